@@ -3,9 +3,16 @@
 
 from __future__ import annotations
 
+from collections.abc import Hashable, Sequence
+
 from NodeUtil.NodeBase     import NodeBase
 from NodeUtil.NodeInitData import NodeInitData
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 
 NodeBase.trace_node_name('NodeListSplitByBool')
 
@@ -32,42 +39,124 @@ class NodeListSplitByBool(NodeBase):
         """
         self._set_init_node_output(self.build_ele.ListIfTrue)
         self._set_init_node_output(self.build_ele.ListIfFalse)
+        self._set_init_node_output(self.build_ele.Groups)
+        self._set_init_node_output(self.build_ele.Keys)
 
         list_to_split = self.build_ele.ListToSplit.value
         boolmask = self.build_ele.BoolMask.value
+        group_by_key = self.build_ele.GroupByKey.value
+        output_indices = self.build_ele.OutputIndices.value
 
         if list_to_split == []:
             self.warning = "List is empty"
             return
 
-        if boolmask:
-            boolmask = self.normalize_boolmask(boolmask)
-            if len(boolmask) < len(list_to_split):
-                boolmask += [False] * (len(list_to_split) - len(boolmask))
-            self.build_ele.ListIfTrue.value = [item for idx, item in enumerate(list_to_split) if boolmask[idx]]
-            self.build_ele.ListIfFalse.value = [item for idx, item in enumerate(list_to_split) if not boolmask[idx]]
+        # Indices of the items instead of the items
+        if output_indices:
+            list_to_split = range(len(list_to_split))
+
+        has_mask = boolmask is not None and len(boolmask) > 0
+
+        # Mask of keys, one group per key
+        if group_by_key:
+            try:
+                keys, groups = self.split_by_key(list_to_split, boolmask if has_mask else [])
+            except TypeError as e:
+                self.error = f"Invalid key: {e}"
+                return
+            self.build_ele.Keys.value = keys
+            self.build_ele.Groups.value = groups
+            return
+
+        if has_mask:
+            try:
+                boolmask = self.normalize_boolmask(boolmask)
+            except ValueError as e:
+                self.error = str(e)
+                return
+            list_if_true, list_if_false = self.partition(list_to_split, boolmask)
+            self.build_ele.ListIfTrue.value = list_if_true
+            self.build_ele.ListIfFalse.value = list_if_false
         else:
             self.build_ele.ListIfTrue.value = []
-            self.build_ele.ListIfFalse.value = list_to_split
+            self.build_ele.ListIfFalse.value = list(list_to_split) if output_indices else list_to_split
+
+
+    def partition(self,
+                  list_to_split: list,
+                  boolmask:      Sequence) -> tuple[list, list]:
+        """ Split a list in one pass, items after the end of the mask are False
+
+        Args:
+            list_to_split: list of items (or range of indices)
+            boolmask:      mask of 0 / 1 values
+
+        Returns:
+            (items if True, items if False)
+        """
+        list_if_true, list_if_false = [], []
+        append_true, append_false = list_if_true.append, list_if_false.append
+
+        for item, value in zip(list_to_split, boolmask):
+            (append_true if value else append_false)(item)
+
+        if len(boolmask) < len(list_to_split):
+            list_if_false.extend(list_to_split[len(boolmask):])
+
+        return list_if_true, list_if_false
+
 
+    def split_by_key(self,
+                     list_to_split: list,
+                     keys:          Sequence) -> tuple[list, list[list]]:
+        """ Split a list in groups of same key, in one pass
+
+        Items after the end of the mask have the key None.
 
-    def normalize_boolmask(self, boolmask: list) -> list:
-        """ Ensures all entries are bool (True/False)
         Args:
-            boolmask: list to be validate
+            list_to_split: list of items (or range of indices)
+            keys:          key of each item (hashable values)
 
         Returns:
-            list with correct values
+            (keys in order of first occurrence, items of each key)
         """
-        normalized = []
-        for val in boolmask:
-            if isinstance(val, bool):
-                normalized.append(val)
-            elif val == 1:
-                normalized.append(True)
-            elif val == 0:
-                normalized.append(False)
-            else:
-                raise ValueError(f"Invalid mask value: {val}. Only bool, 0, 1 allowed.")
-
-        return normalized
+        if np is not None and isinstance(keys, np.ndarray):
+            keys = keys.tolist()
+
+        groups = {}
+        for item, key in zip(list_to_split, keys):
+            if (group := groups.get(key)) is None:
+                group = groups[key] = []
+            group.append(item)
+
+        if len(keys) < len(list_to_split):
+            groups.setdefault(None, []).extend(list_to_split[len(keys):])
+
+        return list(groups), list(groups.values())
+
+
+    def normalize_boolmask(self, boolmask: Sequence) -> Sequence:
+        """ Check that all entries are bool or 0 / 1
+
+        The mask is returned without copy, except NumPy arrays converted to a list.
+
+        Args:
+            boolmask: list, bytes, array('b') or NumPy array to be validate
+
+        Returns:
+            mask with correct values
+        """
+        if np is not None and isinstance(boolmask, np.ndarray):
+            if boolmask.dtype != bool and not np.isin(boolmask, (0, 1)).all():
+                raise ValueError("Invalid mask value. Only bool, 0, 1 allowed.")
+            return boolmask.astype(bool).tolist()
+
+        try:
+            invalid = set(boolmask) - {0, 1}
+        except TypeError:
+            invalid = [val for val in boolmask if not isinstance(val, Hashable)]
+
+        if invalid:
+            raise ValueError(f"Invalid mask value: {next(iter(invalid))}. Only bool, 0, 1 allowed.")
+
+        return boolmask
@@ -0,0 +1,138 @@
+""" Records passed between the Logic nodes
+
+A case (Case -> MatchCase) and a loop operation (LoopOperation -> LoopFor) are
+lists starting with a marker, as in the first versions of the nodes, so they go
+through the list{} ports. The record classes add the names of the items.
+"""
+from __future__ import annotations
+
+from typing import Any
+
+
+CASE_LIST_MARKER = "__MATCH_CASE_CASELIST__"
+LOOP_LIST_MARKER = "__LOOP_RETURN__"
+
+
+class CaseRecord(list):
+    """ Case of a MatchCase node, output of the Case node: [marker, match value, function]
+    """
+    __slots__ = ()
+
+    def __init__(self,
+                 match_value: Any,
+                 function:    Any):
+        """ Initialization
+
+        Args:
+            match_value: value, list of values or interval to match
+            function:    result of the case
+        """
+        super().__init__((CASE_LIST_MARKER, match_value, function))
+
+
+    @property
+    def match_value(self) -> Any:
+        return self[1]
+
+
+    @property
+    def function(self) -> Any:
+        return self[2]
+
+
+class LoopRecord(list):
+    """ Operation of a LoopFor node, output of the LoopOperation node: [marker, initial value, operation, operand]
+    """
+    __slots__ = ()
+
+    def __init__(self,
+                 init_value: Any,
+                 operation:  str,
+                 operand:    Any):
+        """ Initialization
+
+        Args:
+            init_value: initial value or object
+            operation:  symbol of the operation
+            operand:    operand for the operation
+        """
+        super().__init__((LOOP_LIST_MARKER, init_value, operation, operand))
+
+
+    @property
+    def init_value(self) -> Any:
+        return self[1]
+
+
+    @property
+    def operation(self) -> str:
+        return self[2]
+
+
+    @property
+    def operand(self) -> Any:
+        return self[3]
+
+
+class IntervalRecord:
+    """ Interval match value of a case
+    """
+    __slots__ = ("low", "high", "low_closed", "high_closed")
+
+    def __init__(self,
+                 low:         float,
+                 high:        float,
+                 low_closed:  bool,
+                 high_closed: bool):
+        """ Initialization
+
+        Args:
+            low:         lower bound
+            high:        upper bound
+            low_closed:  lower bound included
+            high_closed: upper bound included
+        """
+        self.low         = low
+        self.high        = high
+        self.low_closed  = low_closed
+        self.high_closed = high_closed
+
+
+    def __repr__(self) -> str:
+        return f"{'[' if self.low_closed else ']'}{self.low}, {self.high}{']' if self.high_closed else '['}"
+
+
+def as_case_record(item: Any) -> CaseRecord | None:
+    """ Case record of an item of Cases, the lists copied by a port are accepted
+
+    Args:
+        item: output of a Case node
+
+    Returns:
+        case record, None if the item is not a case
+    """
+    if isinstance(item, CaseRecord):
+        return item
+
+    if isinstance(item, list) and len(item) == 3 and item[0] == CASE_LIST_MARKER:
+        return CaseRecord(item[1], item[2])
+
+    return None
+
+
+def as_loop_record(item: Any) -> LoopRecord | None:
+    """ Loop record of an item of Function, the lists copied by a port are accepted
+
+    Args:
+        item: output of a LoopOperation node
+
+    Returns:
+        loop record, None if the item is not a loop operation
+    """
+    if isinstance(item, LoopRecord):
+        return item
+
+    if isinstance(item, list) and len(item) == 4 and item[0] == LOOP_LIST_MARKER:
+        return LoopRecord(item[1], item[2], item[3])
+
+    return None
@@ -2,14 +2,24 @@
 """
 from __future__ import annotations
 
+import re
+
 from NodeUtil.NodeBase     import NodeBase
 from NodeUtil.NodeInitData import NodeInitData
 
+from LogicRecords import CaseRecord, IntervalRecord
+
 
 NodeBase.trace_node_name('NodeCase')
 
 
-CASE_LIST_MARKER = "__MATCH_CASE_CASELIST__"
+NUMBER = r"[-+]?(?:inf|(?:\d+\.?\d*|\.\d+)(?:e[-+]?\d+)?)"
+
+# Interval with closed / open bounds : [0, 20], ]20; 40], (40, inf)
+INTERVAL_PATTERN = re.compile(rf"^\s*([\[\]\(])\s*({NUMBER})\s*[,;]\s*({NUMBER})\s*([\[\]\)])\s*$", re.IGNORECASE)
+
+# Closed interval : 0..20
+RANGE_PATTERN = re.compile(rf"^\s*({NUMBER})\s*\.\.\s*({NUMBER})\s*$", re.IGNORECASE)
 
 
 def create_node(init_data: NodeInitData) -> NodeCase:
@@ -41,9 +51,36 @@ class NodeCase(NodeBase):
             self.error = "MatchValue can not be empty"
             return
 
-        result = []
-        result.append(CASE_LIST_MARKER)
-        result.append(match_value)
-        result.append(operation)
+        if isinstance(match_value, str):
+            try:
+                match_value = self.parse_interval(match_value)
+            except ValueError as e:
+                self.error = str(e)
+                return
+
+        self.build_ele.Result.value = CaseRecord(match_value, operation)
 
-        self.build_ele.Result.value = result
+
+    def parse_interval(self, text: str) -> str | IntervalRecord:
+        """ Parse an interval match value
+
+        Args:
+            text: match value as text, e.g. "[0, 20[", "(20, 40]", "0..20"
+
+        Returns:
+            interval, or the text if it is not an interval
+        """
+        if match := RANGE_PATTERN.match(text):
+            low, high = float(match.group(1)), float(match.group(2))
+            low_closed = high_closed = True
+        elif match := INTERVAL_PATTERN.match(text):
+            low, high = float(match.group(2)), float(match.group(3))
+            low_closed = match.group(1) == "["
+            high_closed = match.group(4) == "]"
+        else:
+            return text
+
+        if low > high or (low == high and not (low_closed and high_closed)):
+            raise ValueError(f"Empty interval: {text}")
+
+        return IntervalRecord(low, high, low_closed, high_closed)
@@ -2,7 +2,9 @@
 """
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Iterable
+
+import itertools
 
 from NodeUtil.NodeBase     import NodeBase
 from NodeUtil.NodeInitData import NodeInitData
@@ -71,21 +73,16 @@ class NodeIfElse(NodeBase):
             elif not isinstance(on_false, list):
                 on_false = [on_false]
 
-            test_length = len(test)
-            on_true_length = len(on_true)
-            on_false_length = len(on_false)
-            max_length = max(test_length, on_true_length, on_false_length)
+            # Empty condition list
+            if not test:
+                return []
 
-            if test_length < max_length:
-                test += [test[-1]] * (max_length - test_length)
-            if on_true_length < max_length:
-                on_true += [on_true[-1]] * (max_length - on_true_length)
-            if on_false_length < max_length:
-                on_false += [on_false[-1]] * (max_length - on_false_length)
+            max_length = max(len(test), len(on_true), len(on_false))
 
-            result = []
-            for i in range(max_length):
-                result.append(on_true[i] if bool(test[i]) else on_false[i])
+            result = [true_item if bool(test_item) else false_item
+                      for test_item, true_item, false_item in zip(self.broadcast(test, max_length),
+                                                                  self.broadcast(on_true, max_length),
+                                                                  self.broadcast(on_false, max_length))]
 
             if max_length == 1:
                 return result[0]
@@ -94,3 +91,22 @@ class NodeIfElse(NodeBase):
 
         # Test as a single value
         return on_true if bool(test) else on_false
+
+
+    def broadcast(self,
+                  values: list,
+                  length: int) -> Iterable:
+        """ Values of a list extended to a length by repeating its last value
+
+        The list is read as it is, it is not padded (the input of the node is not modified).
+
+        Args:
+            values: list of values
+            length: length of the result
+
+        Returns:
+            values, then the last value up to the length
+        """
+        if len(values) >= length:
+            return values
+        return itertools.chain(values, itertools.repeat(values[-1], length - len(values)))
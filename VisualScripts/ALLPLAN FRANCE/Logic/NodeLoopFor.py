@@ -2,21 +2,60 @@
 """
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Callable
 
+import ast
+import re
 import operator
 import math
+import itertools
+
+from collections import OrderedDict
+from functools import lru_cache
 
 import NemAll_Python_Geometry as Geometry
 
 from NodeUtil.NodeBase     import NodeBase
 from NodeUtil.NodeInitData import NodeInitData
 
+from LogicRecords import as_loop_record
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 
 NodeBase.trace_node_name('NodeLoopFor')
 
 
-LOOP_LIST_MARKER = "__LOOP_RETURN__"
+# Maximum size of the result cache (all nodes), in numbers: about 8 MB
+CHAIN_CACHE_SIZE = 250_000
+
+# Size of a cached Point3D / Vector3D, tuple of 3 floats (about 4.5 times a number)
+COORDS_SIZE = 5
+
+# Types of initial value with a cached result
+CACHED_TYPES = (int, float, Geometry.Point3D, Geometry.Vector3D)
+
+# Minimum number of iterations of a Matrix3D chain calculated with the matrix powers (NumPy)
+MATRIX_POWER_THRESHOLD = 64
+
+# Number of iterations calculated before the first check of the stop condition
+CONDITION_CHUNK = 64
+
+# Variables of the stop condition: value (length of a Point3D / Vector3D), coordinates, iteration
+CONDITION_VARIABLES = ("v", "x", "y", "z", "i")
+
+# Stop condition as a comparison with a threshold, e.g. "> 12"
+COMPARISON_PATTERN = re.compile(r"^(<=|>=|==|!=|<|>)")
+
+# Operand types of a translation chain (+, -)
+GEOM_TRANSLATIONS = {
+    (Geometry.Point3D, Geometry.Point3D),
+    (Geometry.Point3D, Geometry.Vector3D),
+    (Geometry.Vector3D, Geometry.Vector3D),
+    }
 
 # Authorized operators
 
@@ -49,6 +88,31 @@ MATH_FUNCS = {
     "exp": math.exp,       # e**x
     }
 
+MATH_CONSTS = {
+    "pi": math.pi,
+    "e": math.e,
+    }
+
+# Operators of the stop condition
+
+CONDITION_OPS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.Mod: operator.mod,
+    ast.Pow: operator.pow,
+    ast.USub: operator.neg,
+    ast.UAdd: operator.pos,
+    ast.Not: operator.not_,
+    ast.Lt: operator.lt,
+    ast.LtE: operator.le,
+    ast.Gt: operator.gt,
+    ast.GtE: operator.ge,
+    ast.Eq: operator.eq,
+    ast.NotEq: operator.ne,
+    }
+
 
 def create_node(init_data: NodeInitData) -> NodeLoopFor:
     """ Create the node
@@ -63,6 +127,155 @@ def create_node(init_data: NodeInitData) -> NodeLoopFor:
     return NodeLoopFor(init_data)
 
 
+class ChainCache:
+    """ LRU cache of the chain results, limited by the size of the cached values
+    """
+
+    def __init__(self, size: int):
+        """ Initialization
+
+        Args:
+            size: maximum size of the cached values (a number counts 1, coordinates COORDS_SIZE)
+        """
+        self.size    = size
+        self.count   = 0
+        self.entries = OrderedDict()
+
+
+    def get(self, key: tuple) -> list | None:
+        """ Get the values of a chain
+
+        Args:
+            key: key of the chain
+
+        Returns:
+            cached values, None if the chain is not cached
+        """
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        self.entries.move_to_end(key)
+        return entry[0]
+
+
+    def put(self,
+            key:    tuple,
+            values: list):
+        """ Store the values of a chain, the least recently used chains are removed
+
+        Args:
+            key:    key of the chain
+            values: values of the chain
+        """
+        if (old_entry := self.entries.pop(key, None)) is not None:
+            self.count -= old_entry[1]
+
+        size = len(values) * (COORDS_SIZE if values and type(values[0]) is tuple else 1)
+        if size > self.size:
+            return
+
+        while self.entries and self.count + size > self.size:
+            self.count -= self.entries.popitem(last= False)[1][1]
+
+        self.entries[key] = (values, size)
+        self.count += size
+
+
+CHAIN_CACHE = ChainCache(CHAIN_CACHE_SIZE)
+
+
+@lru_cache(maxsize= 256)
+def compile_condition(text: str) -> Callable[[tuple], Any]:
+    """ Check a stop condition against the authorized operators, functions and
+    variables, and compile it to a callable
+
+    Args:
+        text: stop condition, e.g. "v > 12", "abs(v) < 0.001 or i >= 50"
+
+    Returns:
+        callable evaluating the condition for the values of CONDITION_VARIABLES
+    """
+    # Comparison with a threshold : "> 12" is "v > 12"
+    if COMPARISON_PATTERN.match(text):
+        text = f"v {text}"
+
+    try:
+        tree = ast.parse(text, mode='eval')
+    except SyntaxError as e:
+        raise ValueError(f"Syntax error: {e}") from e
+
+    return _compile_condition_node(tree.body)
+
+
+def _compile_condition_node(node: ast.AST) -> Callable[[tuple], Any]:
+    """ Compile an AST node of a stop condition to a callable
+
+    Args:
+        node: AST node
+
+    Returns:
+        callable evaluating the node for the variable values
+    """
+    # Numerical constants (integer / float)
+    if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)):
+        value = node.value
+        return lambda env: value
+
+    # Binary and unary operations
+    if isinstance(node, (ast.BinOp, ast.UnaryOp)) and type(node.op) in CONDITION_OPS:
+        op_func = CONDITION_OPS[type(node.op)]
+        if isinstance(node, ast.UnaryOp):
+            operand = _compile_condition_node(node.operand)
+            return lambda env: op_func(operand(env))
+        left = _compile_condition_node(node.left)
+        right = _compile_condition_node(node.right)
+        return lambda env: op_func(left(env), right(env))
+
+    # Comparisons, chained comparisons : 0 < x <= 10
+    if isinstance(node, ast.Compare):
+        if any(type(op) not in CONDITION_OPS for op in node.ops):
+            raise ValueError("Comparison not allowed")
+        op_funcs = [CONDITION_OPS[type(op)] for op in node.ops]
+        terms = [_compile_condition_node(term) for term in [node.left, *node.comparators]]
+
+        def compare(env):
+            left = terms[0](env)
+            for op_func, term in zip(op_funcs, terms[1:]):
+                right = term(env)
+                if not op_func(left, right):
+                    return False
+                left = right
+            return True
+        return compare
+
+    # and / or
+    if isinstance(node, ast.BoolOp):
+        values = [_compile_condition_node(value) for value in node.values]
+        if isinstance(node.op, ast.And):
+            return lambda env: all(value(env) for value in values)
+        return lambda env: any(value(env) for value in values)
+
+    # Mathematical operations : sqrt(x), abs(x), sin(x) ...
+    if isinstance(node, ast.Call):
+        if isinstance(node.func, ast.Name) and node.func.id in MATH_FUNCS:
+            func = MATH_FUNCS[node.func.id]
+            args = [_compile_condition_node(arg) for arg in node.args]
+            return lambda env: func(*[arg(env) for arg in args])
+        raise ValueError("Function not allowed")
+
+    # Mathematical constants : pi, e, and variables
+    if isinstance(node, ast.Name):
+        if node.id in MATH_CONSTS:
+            value = MATH_CONSTS[node.id]
+            return lambda env: value
+        if node.id in CONDITION_VARIABLES:
+            index = CONDITION_VARIABLES.index(node.id)
+            return lambda env: env[index]
+        raise ValueError(f"Unknown variable {node.id}")
+
+    raise ValueError(f"Expression not allowed: {type(node).__name__}")
+
+
 class NodeLoopFor(NodeBase):
     """ Definition of class NodeLoopFor
     """
@@ -71,66 +284,630 @@ class NodeLoopFor(NodeBase):
         """ Loop statement
         """
         self._set_init_node_output(self.build_ele.Result)
+        self._set_init_node_output(self.build_ele.Iterations)
         all_results = []
+        all_iterations = []
 
         repeat = self.build_ele.Repeat.value
         functions = self.build_ele.Function.value
+        copy_objects = self.build_ele.CopyObjects.value
+        stop_condition = (self.build_ele.StopCondition.value or "").strip()
+
+        condition = None
+        if stop_condition:
+            try:
+                condition = compile_condition(stop_condition)
+            except ValueError as e:
+                self.error = f"Invalid stop condition: {e}"
+                return
 
-        if len(functions) == 4 and functions[0] == LOOP_LIST_MARKER:
-            functions = [functions]
+        # Single operation
+        if (record := as_loop_record(functions)) is not None:
+            functions = [record]
+
+        functions = functions if isinstance(functions, list) else []
 
         for idx, f in enumerate(functions):
-            if f[0] != LOOP_LIST_MARKER:
+            if (record := as_loop_record(f)) is None:
                 self.error = "Invalid node, please use LoopOperation."
                 return
+
+            initvalue, operation, operand = record.init_value, record.operation, record.operand
+            result = []
+            duplicate = (
+                hasattr(initvalue, '__module__') and
+                initvalue.__module__ == "NemAll_Python_Geometry" and
+                (operand is None or operand == 0)
+                )
+            is_operand_list = isinstance(operand, (list, tuple))
+
+            # Check list homogeneity
+            if is_operand_list and operand:
+                types_set = set(type(item) for item in operand)
+                if len(types_set) != 1:
+                    self.error = f"All operands in the list must be of the same type (found: {list(types_set)})."
+                    return
+
+            if duplicate and not copy_objects:
+                # Same instance for each iteration, no copy
+                all_results.append([initvalue] * repeat)
+                all_iterations.append(repeat)
+            elif duplicate:
+                for i in range(repeat):
+                    try:
+                        geo_type = type(initvalue)
+                        geo_copied = geo_type(initvalue)
+                        result.append(geo_copied)
+                    except Exception:
+                        result.append(initvalue)
+                all_results.append(result)
+                all_iterations.append(repeat)
             else:
-                if len(f) == 4:
-                    marker, initvalue, operation, operand = f
-                    result = []
-                    duplicate = (
-                        hasattr(initvalue, '__module__') and
-                        initvalue.__module__ == "NemAll_Python_Geometry" and
-                        (operand is None or operand == 0)
-                        )
-                    is_operand_list = isinstance(operand, (list, tuple))
-
-                    # Check list homogeneity
-                    if is_operand_list and operand:
-                        types_set = set(type(item) for item in operand)
-                        if len(types_set) != 1:
-                            self.error = f"All operands in the list must be of the same type (found: {list(types_set)})."
-                            return
-
-                    if duplicate:
-                        for i in range(repeat):
-                            try:
-                                geo_type = type(initvalue)
-                                geo_copied = geo_type(initvalue)
-                                result.append(geo_copied)
-                            except Exception:
-                                result.append(initvalue)
-                        all_results.append(result)
-                    else:
-                        current_value = initvalue
-                        for i in range(repeat):
-                            if is_operand_list:
-                                current_operand = operand[i] if i < len(operand) else operand[-1]
-                            else:
-                                current_operand = operand
-                            new_func = [current_value, operation, current_operand]
-                            if hasattr(initvalue, '__module__') and initvalue.__module__ == "NemAll_Python_Geometry":
-                                current_operand = float(current_operand) if isinstance(current_operand, int) else current_operand
-                                res = self.operate_geom(current_value, operation, current_operand)
-                            else:
-                                res = self.calculate_operation(new_func)
-                            result.append(res)
-                            current_value = res
-                        all_results.append(result)
+                if condition is None:
+                    result = self.cached_chain(idx, initvalue, operation, operand, repeat)
+                else:
+                    result = self.conditional_chain(idx, initvalue, operation, operand, repeat, condition)
+                all_results.append(result)
+                all_iterations.append(len(result))
 
         if len(functions) > 1:
             self.build_ele.Result.value = all_results
+            self.build_ele.Iterations.value = all_iterations
         else:
             self.build_ele.Result.value = all_results[0] if all_results else []
+            self.build_ele.Iterations.value = all_iterations[0] if all_iterations else 0
+
+
+    def conditional_chain(self,
+                          index:     int,
+                          initvalue: Any,
+                          operation: str,
+                          operand:   Any,
+                          repeat:    int,
+                          condition: Callable[[tuple], Any]) -> list:
+        """ Result of a chain stopped at the first iteration meeting the stop condition
+
+        The chain is calculated by blocks of increasing size, each block resumes
+        the chain from the cache. Repeat is the maximum number of iterations.
+
+        Args:
+            index:     index of the chain in Function
+            initvalue: initial value
+            operation: symbol of the operation
+            operand:   operand for the operation (object, number or list)
+            repeat:    maximum number of iterations
+            condition: compiled stop condition
+
+        Returns:
+            result of each iteration, up to the first one meeting the condition (included)
+        """
+        values = []
+        checked = 0
+        count = min(CONDITION_CHUNK, repeat)
+
+        while checked < repeat:
+            values = self.cached_chain(index, initvalue, operation, operand, count)
+
+            for i in range(checked, len(values)):
+                try:
+                    stop = condition(self.condition_env(values[i], i + 1))
+                except (TypeError, ValueError, ArithmeticError) as e:
+                    # An error of the operation is already reported
+                    if not self.error:
+                        self.error = f"Stop condition error: {e}"
+                    return values[:i]
+                if stop:
+                    return values[:i + 1]
+
+            checked = count
+            count = min(count * 2, repeat)
+
+        return values
+
+
+    def condition_env(self,
+                      value:     Any,
+                      iteration: int) -> tuple:
+        """ Values of the stop condition variables for one iteration
+
+        Args:
+            value:     value of the iteration (number, Point3D or Vector3D)
+            iteration: number of the iteration (from 1)
+
+        Returns:
+            values of CONDITION_VARIABLES (v, x, y, z, i)
+        """
+        if isinstance(value, (int, float)):
+            return (value, value, 0.0, 0.0, iteration)
+
+        if type(value) in (Geometry.Point3D, Geometry.Vector3D):
+            x, y, z = value.X, value.Y, value.Z
+            return (math.sqrt(x * x + y * y + z * z), x, y, z, iteration)
+
+        raise TypeError(f"unsupported value {type(value).__name__}")
+
+
+    def cached_chain(self,
+                     index:     int,
+                     initvalue: Any,
+                     operation: str,
+                     operand:   Any,
+                     repeat:    int) -> list:
+        """ Result of a chain, taken from the cache when the chain inputs are unchanged
+
+        When Repeat goes up, the chain is resumed from the last cached value,
+        when it goes down, the cached values are sliced.
+
+        Args:
+            index:     index of the chain in Function
+            initvalue: initial value
+            operation: symbol of the operation
+            operand:   operand for the operation (object, number or list)
+            repeat:    number of iterations
+
+        Returns:
+            result of each iteration
+        """
+        key = self.chain_key(index, initvalue, operation, operand)
+        if key is None or repeat <= 0:
+            return self.calculate_chain(initvalue, operation, operand, repeat)
+
+        geo_type = type(initvalue) if self.is_geometry(initvalue) else None
+        cached = CHAIN_CACHE.get(key) or []
+
+        if len(cached) < repeat:
+            start = len(cached)
+            if cached:
+                initvalue = geo_type(*cached[-1]) if geo_type else cached[-1]
+                if isinstance(operand, (list, tuple)):
+                    operand = operand[start:] or operand[-1:]
+            values = self.calculate_chain(initvalue, operation, operand, repeat - start)
+
+            # Chains with an error are not cached
+            if geo_type:
+                if not all(type(value) is geo_type for value in values):
+                    return [geo_type(*coords) for coords in cached] + values
+                values = [(value.X, value.Y, value.Z) for value in values]
+            elif not all(isinstance(value, (int, float)) for value in values):
+                return cached + values
+            cached = cached + values
+            CHAIN_CACHE.put(key, cached)
+
+        if geo_type:
+            return [geo_type(*coords) for coords in itertools.islice(cached, repeat)]
+        return cached[:repeat]
+
+
+    def chain_key(self,
+                  index:     int,
+                  initvalue: Any,
+                  operation: str,
+                  operand:   Any) -> tuple | None:
+        """ Cache key of a chain
+
+        Args:
+            index:     index of the chain in Function
+            initvalue: initial value
+            operation: symbol of the operation
+            operand:   operand for the operation (object, number or list)
+
+        Returns:
+            key, None if the chain can not be cached
+        """
+        if not isinstance(operation, str) or type(initvalue) not in CACHED_TYPES:
+            return None
+
+        init_key = self.value_key(initvalue)
+        if isinstance(operand, (list, tuple)):
+            operand_key = tuple(self.value_key(item) for item in operand)
+            if None in operand_key:
+                return None
+        elif (operand_key := self.value_key(operand)) is None:
+            return None
+
+        return (index, init_key, operation, operand_key)
+
+
+    def value_key(self, value: Any) -> tuple | None:
+        """ Key of a chain value, the type is part of the key (1 and 1.0 are different)
+
+        Args:
+            value: number, Point3D, Vector3D or None
+
+        Returns:
+            key, None if the value can not be used in a cache key
+        """
+        value_type = type(value)
+
+        if value is None:
+            return (None,)
+        if value_type is float:
+            return (float, value.hex())
+        if value_type in (int, bool):
+            return (value_type, value)
+        if value_type in (Geometry.Point3D, Geometry.Vector3D):
+            return (value_type, float(value.X).hex(), float(value.Y).hex(), float(value.Z).hex())
+        return None
+
+
+    def calculate_chain(self,
+                        initvalue: Any,
+                        operation: str,
+                        operand:   Any,
+                        repeat:    int) -> list:
+        """ Calculate a chain
+
+        Args:
+            initvalue: initial value
+            operation: symbol of the operation
+            operand:   operand for the operation (object, number or list)
+            repeat:    number of iterations
+
+        Returns:
+            result of each iteration
+        """
+        if (accumulated := self.accumulate_chain(initvalue, operation, operand, repeat)) is not None:
+            return accumulated
+        elif (accumulated := self.accumulate_geom_chain(initvalue, operation, operand, repeat)) is not None:
+            return accumulated
+        elif (accumulated := self.run_kernel_chain(initvalue, operation, operand, repeat)) is not None:
+            return accumulated
+
+        result = []
+        is_operand_list = isinstance(operand, (list, tuple))
+        current_value = initvalue
+        for i in range(repeat):
+            if is_operand_list:
+                current_operand = operand[i] if i < len(operand) else operand[-1]
+            else:
+                current_operand = operand
+            new_func = [current_value, operation, current_operand]
+            if hasattr(initvalue, '__module__') and initvalue.__module__ == "NemAll_Python_Geometry":
+                current_operand = float(current_operand) if isinstance(current_operand, int) else current_operand
+                res = self.operate_geom(current_value, operation, current_operand)
+            else:
+                res = self.calculate_operation(new_func)
+            result.append(res)
+            current_value = res
+        return result
+
+
+    def accumulate_chain(self,
+                         initvalue: Any,
+                         operation: str,
+                         operand:   Any,
+                         repeat:    int) -> list | None:
+        """ Calculate a numeric chain in one step
+
+        A scalar operand gives an arithmetic / geometric progression, a list operand
+        gives prefix sums / products. Values are accumulated with the same operations
+        as the step by step loop, so the results are identical.
+
+        Args:
+            initvalue: initial value
+            operation: symbol of the operation (+, -, *, /, %, **)
+            operand:   operand for the operation (number or list of numbers)
+            repeat:    number of iterations
+
+        Returns:
+            result of each iteration, None if the chain can not be calculated in one step
+        """
+        if not isinstance(initvalue, (int, float)) or operation not in OPS:
+            return None
+
+        if isinstance(operand, (list, tuple)):
+            if not operand or not all(isinstance(item, (int, float)) for item in operand):
+                return None
+            operands = self.expand_operand(operand, repeat)
+        elif isinstance(operand, (int, float)):
+            # Integer arithmetic progression
+            if operation in ("+", "-") and type(initvalue) is int and type(operand) is int and operand != 0:
+                step = operand if operation == "+" else -operand
+                return list(range(initvalue + step, initvalue + step * (repeat + 1), step))
+            operands = itertools.repeat(operand, repeat)
+        else:
+            return None
+
+        # Division by zero is reported by the step by step loop
+        if operation in ("/", "%") and (operand == 0 if not isinstance(operand, (list, tuple)) else 0 in operands):
+            return None
+
+        return list(itertools.islice(itertools.accumulate(operands, OPS[operation], initial= initvalue), 1, None))
+
+
+    def accumulate_geom_chain(self,
+                              initvalue: Any,
+                              operation: str,
+                              operand:   Any,
+                              repeat:    int) -> list | None:
+        """ Calculate a Point3D / Vector3D chain on coordinates
+
+        The coordinates of each iteration are calculated without creating the
+        intermediate geometry objects, which are all created at the end.
+
+        Args:
+            initvalue: initial Point3D / Vector3D
+            operation: symbol of the operation (+, -, *, /)
+            operand:   operand for the operation (object, number or list)
+            repeat:    number of iterations
+
+        Returns:
+            result of each iteration, None if the chain can not be calculated on coordinates
+        """
+        geo_type = type(initvalue)
+
+        if geo_type not in (Geometry.Point3D, Geometry.Vector3D) or operation not in OPS or repeat <= 0:
+            return None
+
+        operands = self.expand_operand(operand, repeat) if isinstance(operand, (list, tuple)) else [operand] * repeat
+        if not operands:
+            return None
+
+        operand_type = type(operands[0])
+        if any(type(item) is not operand_type for item in operands):
+            return None
+
+        op_func = OPS[operation]
+
+        # The chain must keep the type of the initial value (Point3D - Point3D is a Vector3D),
+        # checked on the first iteration before any coordinate is calculated
+        try:
+            if type(op_func(initvalue, operands[0])) is not geo_type:
+                return None
+        except Exception:
+            return None
+
+        # Translation: Point3D + Point3D / Vector3D, Vector3D + Vector3D
+        if operation in ("+", "-") and (geo_type, operand_type) in GEOM_TRANSLATIONS:
+            steps = [[item.X for item in operands], [item.Y for item in operands], [item.Z for item in operands]]
+            coords = [self.accumulate_coord(start, op_func, step)
+                      for start, step in zip((initvalue.X, initvalue.Y, initvalue.Z), steps)]
+
+        # Scaling by a number
+        elif operation in ("*", "/") and operand_type in (int, float):
+            operands = [float(item) for item in operands]
+            if operation == "/" and 0.0 in operands:
+                return None
+            coords = [self.accumulate_coord(start, op_func, operands)
+                      for start in (initvalue.X, initvalue.Y, initvalue.Z)]
+
+        # Transformation by a Matrix3D
+        elif operation == "*" and operand_type is Geometry.Matrix3D:
+            coords = self.transform_coords(initvalue, operands)
+            if coords is None:
+                return None
+
+        else:
+            return None
+
+        return [geo_type(x, y, z) for x, y, z in zip(*coords)]
+
+
+    def run_kernel_chain(self,
+                         initvalue: Any,
+                         operation: str,
+                         operand:   Any,
+                         repeat:    int) -> list | None:
+        """ Run a chain step by step with an operation resolved once for the whole chain
+
+        Args:
+            initvalue: initial value
+            operation: symbol of the operation
+            operand:   operand for the operation (object, number or list)
+            repeat:    number of iterations
+
+        Returns:
+            result of each iteration, None if no operation can be resolved for the chain
+        """
+        if repeat <= 0:
+            return None
+
+        operands = self.expand_operand(operand, repeat) if isinstance(operand, (list, tuple)) else [operand] * repeat
+        if not operands:
+            return None
+
+        kernel = self.resolve_kernel(initvalue, operation, operands)
+        if kernel is None:
+            return None
+
+        result = [kernel(initvalue, operands[0])]
+
+        # Geometry chain must keep its type, the operation is resolved for this type
+        if self.is_geometry(initvalue) and type(result[0]) is not type(initvalue):
+            return None
+
+        current_value = result[0]
+        for current_operand in itertools.islice(operands, 1, None):
+            current_value = kernel(current_value, current_operand)
+            result.append(current_value)
+        return result
+
+
+    def resolve_kernel(self,
+                       initvalue: Any,
+                       operation: str,
+                       operands:  list) -> Callable[[Any, Any], Any] | None:
+        """ Resolve the operation of a chain from (value type, operand type, operation)
+
+        Args:
+            initvalue: initial value
+            operation: symbol of the operation
+            operands:  operand of each iteration (same type)
+
+        Returns:
+            function (value, operand) -> result, None if the chain must be checked at each step
+        """
+        operand_type = type(operands[0])
+
+        # Geometry: same cases as operate_geom
+        if self.is_geometry(initvalue):
+            value_type = type(initvalue)
+            op_func = OPS.get(operation)
+            if op_func is None or value_type not in (Geometry.Point3D, Geometry.Vector3D):
+                return None
+            if operation in ("+", "-") and (value_type, operand_type) in GEOM_TRANSLATIONS:
+                return op_func
+            if operation in ("*", "/"):
+                if operand_type is int:
+                    operands[:] = [float(item) for item in operands]
+                return op_func
+            return None
+
+        # Numbers
+        if operation in OPS:
+            if operation in ("/", "%") and any(item == 0 for item in operands):
+                return None
+            return OPS[operation]
+
+        if operation in MATH_FUNCS:
+            func = MATH_FUNCS[operation]
+            return (lambda value, operand: func(operand)) if operands[0] is not None else (lambda value, operand: func(value))
+
+        return None
+
+
+    def is_geometry(self, value: Any) -> bool:
+        """ Check if value is a NemAll geometry object
+
+        Args:
+            value: value to check
+
+        Returns:
+            True / False
+        """
+        return getattr(type(value), '__module__', None) == "NemAll_Python_Geometry"
+
+
+    def expand_operand(self,
+                       operand: list | tuple,
+                       repeat:  int) -> list:
+        """ Operand of each iteration, the last operand of the list is used for the remaining iterations
+
+        Args:
+            operand: list of operands
+            repeat:  number of iterations
+
+        Returns:
+            list of operands
+        """
+        return list(itertools.chain(operand[:repeat], itertools.repeat(operand[-1], max(repeat - len(operand), 0))))
+
+
+    def accumulate_coord(self,
+                         start:    float,
+                         op_func:  Any,
+                         operands: list) -> list:
+        """ Accumulate an operation on one coordinate
+
+        Args:
+            start:    initial coordinate
+            op_func:  operation
+            operands: operand of each iteration
+
+        Returns:
+            coordinate of each iteration
+        """
+        return list(itertools.islice(itertools.accumulate(operands, op_func, initial= start), 1, None))
+
+
+    def transform_coords(self,
+                         initvalue: Any,
+                         matrices:  list) -> list | None:
+        """ Calculate the coordinates of a chain of Matrix3D transformations
+
+        Args:
+            initvalue: initial Point3D / Vector3D
+            matrices:  matrix of each iteration
+
+        Returns:
+            [x list, y list, z list], None if a matrix is not an affine transformation
+        """
+        affines = {}
+        xs, ys, zs = [], [], []
+        x, y, z = initvalue.X, initvalue.Y, initvalue.Z
+
+        # Same matrix for each iteration: element i is transformed by M^i
+        if np is not None and len(matrices) >= MATRIX_POWER_THRESHOLD and all(matrix is matrices[0] for matrix in matrices):
+            affine = self.matrix_affine(type(initvalue), matrices[0])
+            if affine is None:
+                return None
+            return self.power_coords((x, y, z), affine, len(matrices))
+
+        for matrix in matrices:
+            if (affine := affines.get(id(matrix))) is None:
+                affine = affines[id(matrix)] = self.matrix_affine(type(initvalue), matrix)
+                if affine is None:
+                    return None
+            (a00, a01, a02, t0), (a10, a11, a12, t1), (a20, a21, a22, t2) = affine
+            x, y, z = (a00 * x + a01 * y + a02 * z + t0,
+                       a10 * x + a11 * y + a12 * z + t1,
+                       a20 * x + a21 * y + a22 * z + t2)
+            xs.append(x)
+            ys.append(y)
+            zs.append(z)
+
+        return [xs, ys, zs]
+
+
+    def power_coords(self,
+                     start:  tuple,
+                     affine: tuple,
+                     count:  int) -> list:
+        """ Coordinates of the transformations of a point by the powers M^1 ... M^count
+
+        The points are calculated by blocks: the points M^(n+1) ... M^(2n) are the
+        points M^1 ... M^n transformed by M^n, and M^(2n) is calculated by squaring M^n.
+        A point is obtained with log2(count) transformations instead of count.
+
+        Args:
+            start:  initial coordinates (x, y, z)
+            affine: 3 rows (a0, a1, a2, t) of the transformation
+            count:  number of iterations
+
+        Returns:
+            [x list, y list, z list]
+        """
+        matrix = np.vstack([np.array(affine, dtype= float), (0.0, 0.0, 0.0, 1.0)])
+        points = np.empty((count, 3))
+        points[0] = matrix[:3, :3] @ start + matrix[:3, 3]
+
+        size = 1
+        while size < count:
+            block = min(size, count - size)
+            points[size:size + block] = points[:block] @ matrix[:3, :3].T + matrix[:3, 3]
+            matrix = matrix @ matrix
+            size += block
+
+        return points.T.tolist()
+
+
+    def matrix_affine(self,
+                      geo_type: type,
+                      matrix:   Any) -> tuple | None:
+        """ Coefficients of the transformation of a Point3D / Vector3D by a Matrix3D
+
+        The coefficients are read by transforming the origin and the unit vectors.
+
+        Args:
+            geo_type: Point3D or Vector3D
+            matrix:   transformation matrix
+
+        Returns:
+            3 rows (a0, a1, a2, t) with x' = a0 * x + a1 * y + a2 * z + t,
+            None if the vectors are translated by the matrix
+        """
+        zero = Geometry.Vector3D(0.0, 0.0, 0.0) * matrix
+        if (zero.X, zero.Y, zero.Z) != (0.0, 0.0, 0.0):
+            return None
+
+        origin = geo_type(0.0, 0.0, 0.0) * matrix
+        axes = [Geometry.Vector3D(1.0, 0.0, 0.0) * matrix,
+                Geometry.Vector3D(0.0, 1.0, 0.0) * matrix,
+                Geometry.Vector3D(0.0, 0.0, 1.0) * matrix]
+
+        return ((axes[0].X, axes[1].X, axes[2].X, origin.X),
+                (axes[0].Y, axes[1].Y, axes[2].Y, origin.Y),
+                (axes[0].Z, axes[1].Z, axes[2].Z, origin.Z))
 
 
     def calculate_operation(self,
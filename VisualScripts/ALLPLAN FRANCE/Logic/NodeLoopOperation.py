@@ -5,11 +5,10 @@ from __future__ import annotations
 from NodeUtil.NodeBase     import NodeBase
 from NodeUtil.NodeInitData import NodeInitData
 
-
-NodeBase.trace_node_name('NodeLoopOperation')
+from LogicRecords import LoopRecord
 
 
-LOOP_LIST_MARKER = "__LOOP_RETURN__"
+NodeBase.trace_node_name('NodeLoopOperation')
 
 
 def create_node(init_data: NodeInitData) -> NodeLoopOperation:
@@ -38,10 +37,4 @@ class NodeLoopOperation(NodeBase):
         operation = self.build_ele.Operation.value
         operand = self.build_ele.Operand.value
 
-        result = []
-        result.append(LOOP_LIST_MARKER)
-        result.append(init_value)
-        result.append(operation)
-        result.append(operand)
-
-        self.build_ele.Result.value = result
+        self.build_ele.Result.value = LoopRecord(init_value, operation, operand)
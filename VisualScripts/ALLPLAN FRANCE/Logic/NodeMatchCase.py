@@ -2,14 +2,160 @@
 """
 from __future__ import annotations
 
+from typing import Any, NamedTuple
+
+from bisect import bisect_right
+
 from NodeUtil.NodeBase     import NodeBase
 from NodeUtil.NodeInitData import NodeInitData
 
+from LogicRecords import IntervalRecord, as_case_record
+
 
 NodeBase.trace_node_name('NodeMatchCase')
 
 
-CASE_LIST_MARKER = "__MATCH_CASE_CASELIST__"
+# Maximum number of case lists kept compiled
+INDEX_CACHE_SIZE = 64
+
+# Match values found with a dict lookup (hash consistent with ==)
+INDEX_TYPES = (int, float, str, bool, type(None))
+
+
+class CaseIndex(NamedTuple):
+    """ Compiled case list
+    """
+    match_values: list     # match values of the cases (kept alive for the cache key)
+    index:        dict     # match value -> position of the first case
+    scan:         tuple    # (position, match value) compared one by one (other types)
+    intervals:    tuple    # (interval, position) sorted by lower bound
+    lows:         list     # lower bound of each interval
+    overlap:      bool     # some intervals overlap
+
+
+# Compiled case lists by identity (and content of the lists) of the match values
+CASE_INDEX_CACHE: dict[tuple, CaseIndex] = {}
+
+
+def get_case_index(match_values: list) -> CaseIndex:
+    """ Compiled case list, cached by identity of the match values
+
+    The case nodes create new match values when they run again, so an unchanged
+    case list is compiled only once. The cached match values are kept alive,
+    their identities can not be reused by other objects. A list match value can
+    be changed in place, its content is part of the key.
+
+    Args:
+        match_values: match value of each case
+
+    Returns:
+        compiled case list
+    """
+    key = tuple((id(match_value), tuple(match_value)) if isinstance(match_value, list) else id(match_value)
+                for match_value in match_values)
+
+    # Unhashable content (nested lists...), compiled without cache
+    try:
+        hash(key)
+    except TypeError:
+        return build_case_index(match_values)
+
+    if (case_index := CASE_INDEX_CACHE.pop(key, None)) is None:
+        case_index = build_case_index(match_values)
+        if len(CASE_INDEX_CACHE) >= INDEX_CACHE_SIZE:
+            del CASE_INDEX_CACHE[next(iter(CASE_INDEX_CACHE))]
+
+    # Most recently used at the end
+    CASE_INDEX_CACHE[key] = case_index
+    return case_index
+
+
+def build_case_index(match_values: list) -> CaseIndex:
+    """ Compile the match values of the cases to a dict index, the first case wins
+
+    Args:
+        match_values: match value of each case (single value or list of values)
+
+    Returns:
+        compiled case list
+    """
+    index = {}
+    scan = []
+    intervals = []
+
+    for position, match_value in enumerate(match_values):
+        if is_interval(match_value):
+            intervals.append((match_value, position))
+            continue
+        for item in (match_value if isinstance(match_value, list) else (match_value,)):
+            if type(item) in INDEX_TYPES and item == item:
+                index.setdefault(item, position)
+            else:
+                scan.append((position, item))
+
+    # Sorted by lower bound, a closed bound first
+    intervals.sort(key= lambda item: (item[0].low, not item[0].low_closed))
+
+    overlap = any(previous.high > current.low or
+                  (previous.high == current.low and previous.high_closed and current.low_closed)
+                  for (previous, _), (current, _) in zip(intervals, intervals[1:]))
+
+    return CaseIndex(list(match_values), index, tuple(scan), tuple(intervals),
+                     [interval.low for interval, _ in intervals], overlap)
+
+
+def is_interval(match_value: Any) -> bool:
+    """ Check if a match value is an interval from a Case node
+
+    Args:
+        match_value: match value
+
+    Returns:
+        True / False
+    """
+    return isinstance(match_value, IntervalRecord)
+
+
+def in_interval(value:    Any,
+                interval: IntervalRecord) -> bool:
+    """ Check if a value is in an interval
+
+    Args:
+        value:    value to test
+        interval: interval
+
+    Returns:
+        True / False
+    """
+    return ((interval.low < value or (interval.low_closed and interval.low == value)) and
+            (value < interval.high or (interval.high_closed and value == interval.high)))
+
+
+def find_interval(value:      int | float,
+                  case_index: CaseIndex) -> int | None:
+    """ Find the first case with an interval containing the value
+
+    Without overlap, the interval is found with bisect: only the last interval
+    starting before the value, and the previous one for a shared bound, can contain it.
+
+    Args:
+        value:      value to test
+        case_index: compiled case list
+
+    Returns:
+        position of the case, None if no interval contains the value
+    """
+    if case_index.overlap:
+        positions = [position for interval, position in case_index.intervals if in_interval(value, interval)]
+        return min(positions, default= None)
+
+    i = bisect_right(case_index.lows, value) - 1
+
+    for interval, position in case_index.intervals[max(i - 1, 0):i + 1][::-1]:
+        if in_interval(value, interval):
+            return position
+
+    return None
 
 
 def create_node(init_data: NodeInitData) -> NodeMatchCase:
@@ -38,36 +184,123 @@ class NodeMatchCase(NodeBase):
         cases = self.build_ele.Cases.value
         default = self.build_ele.Default.value
 
-        cases = cases if isinstance(cases, list) else []
+        # Single case
+        if (case := as_case_record(cases)) is not None:
+            cases = [case]
 
-        result = None
-
-        if len(cases) == 3 and cases[0] == CASE_LIST_MARKER:
-            cases = [cases]
+        cases = cases if isinstance(cases, list) else []
+        cases = [case for item in cases if (case := as_case_record(item)) is not None]
 
         # Check if only one type of operations
-        types_set = set(type(case[2]) for case in cases if len(case) == 3 and case[0] == CASE_LIST_MARKER)
+        types_set = set(type(case.function) for case in cases)
         if len(types_set) > 1:
             for typ in types_set:
                 if typ.__module__ != "NemAll_Python_Geometry":
                     self.error = "All operations/functions in cases must be of the same type."
                     return
 
-        for case in cases:
-            if len(case) == 3 and case[0] == CASE_LIST_MARKER:
-                match_value = case[1]
-                operation = case[2]
+        # Value as a list: one result for each value
+        if isinstance(value, list):
+            results = [self.case_result(position, cases, default) for position in self.find_cases(value, cases)]
+            self.build_ele.Result.value = results[0] if len(results) == 1 else results
+            return
+
+        result = self.case_result(self.find_cases([value], cases)[0], cases, default)
+
+        self.build_ele.Result.value = result
+
+
+    def case_result(self,
+                    position: int | None,
+                    cases:    list,
+                    default:  Any) -> Any:
+        """ Result of a matched case, or the default
 
-                if isinstance(match_value, list):
-                    if value in match_value:
-                        result = operation
-                        break
-                else:
-                    if value == match_value:
-                        result = operation
-                        break
+        Args:
+            position: position of the matched case, None if no case matches
+            cases:    valid cases
+            default:  default result
+
+        Returns:
+            result
+        """
+        result = cases[position].function if position is not None else None
 
         if result is None and default is not None:
             result = default
 
-        self.build_ele.Result.value = result
+        return result
+
+
+    def find_cases(self,
+                   values: list,
+                   cases:  list) -> list[int | None]:
+        """ Find the first case matching each value, the case list is compiled once
+
+        Args:
+            values: values to test
+            cases:  valid cases
+
+        Returns:
+            position of the case of each value, None if no case matches
+        """
+        if all(type(value) not in INDEX_TYPES or value != value for value in values):
+            return [self.scan_cases(value, cases) for value in values]
+
+        case_index = get_case_index([case.match_value for case in cases])
+        index_get = case_index.index.get
+        positions = []
+
+        if case_index.overlap:
+            self.warning = "Some intervals of the cases overlap, the first case is used."
+
+        for value in values:
+            if type(value) not in INDEX_TYPES or value != value:
+                positions.append(self.scan_cases(value, cases))
+                continue
+
+            position = index_get(value)
+
+            if case_index.intervals and type(value) in (int, float):
+                interval_position = find_interval(value, case_index)
+                if interval_position is not None and (position is None or interval_position < position):
+                    position = interval_position
+
+            for scan_position, match_value in case_index.scan:
+                if position is not None and scan_position >= position:
+                    break
+                if value == match_value:
+                    position = scan_position
+                    break
+            positions.append(position)
+
+        return positions
+
+
+    def scan_cases(self,
+                   value: Any,
+                   cases: list) -> int | None:
+        """ Find the first case matching the value, case by case
+
+        Args:
+            value: value to test
+            cases: valid cases
+
+        Returns:
+            position of the case, None if no case matches
+        """
+        for position, case in enumerate(cases):
+            match_value = case.match_value
+            if is_interval(match_value):
+                try:
+                    if in_interval(value, match_value):
+                        return position
+                except TypeError:
+                    continue
+            elif isinstance(match_value, list):
+                if value in match_value:
+                    return position
+            elif value == match_value:
+                return position
+
+        return None
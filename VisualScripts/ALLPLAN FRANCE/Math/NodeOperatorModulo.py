@@ -3,6 +3,13 @@
 
 from __future__ import annotations
 
+from typing import Any, Callable
+
+import operator
+import itertools
+
+from collections import Counter
+
 from NodeUtil.NodeBase     import NodeBase
 from NodeUtil.NodeInitData import NodeInitData
 
@@ -10,6 +17,44 @@ from NodeUtil.NodeInitData import NodeInitData
 NodeBase.trace_node_name('OperatorModulo')
 
 
+def real_pow(x: Any,
+             y: Any) -> Any:
+    """ x to the power y, a complex result (negative x, fractional y) is an error
+
+    Args:
+        x: base
+        y: exponent
+
+    Returns:
+        x ** y
+    """
+    result = x ** y
+    if isinstance(result, complex):
+        raise ValueError("complex result")
+    return result
+
+
+# Elementwise operations (x, y)
+
+OPERATIONS = {
+    "%": operator.mod,
+    "//": operator.floordiv,
+    "**": real_pow,
+    "min": min,
+    "max": max,
+    "round": lambda x, y: round(x, int(y)),   # y = number of decimals
+    }
+
+# Errors of one element, the element is set to None
+ELEMENT_ERRORS = (ZeroDivisionError, OverflowError, ValueError)
+
+# Lacing of two lists :
+# Longest  -> the shorter list is extended by repeating its last value
+# Shortest -> the result has the length of the shorter list
+# Cross    -> each value of x with each value of y (list of lists)
+LACINGS = ("Longest", "Shortest", "Cross")
+
+
 def create_node(init_data: NodeInitData) -> NodeOperatorModulo:
     """ Create the node
 
@@ -23,16 +68,91 @@ def create_node(init_data: NodeInitData) -> NodeOperatorModulo:
     return NodeOperatorModulo(init_data)
 
 
+def elementwise(op_func: Callable[[Any, Any], Any],
+                x:       Any,
+                y:       Any,
+                lacing:  str,
+                errors:  list) -> Any:
+    """ Apply an operation element by element, scalars and lists of any depth are broadcast
+
+    A flat level is calculated in one map call, the elements are calculated one by one
+    only if this level contains sub lists or an element error.
+
+    Args:
+        op_func: operation (x, y) -> result
+        x:       number or list
+        y:       number or list
+        lacing:  lacing of two lists (see LACINGS)
+        errors:  elements in error, completed by the function
+
+    Returns:
+        result with the structure of the inputs, None for the elements in error
+    """
+    x_is_list = isinstance(x, list)
+    y_is_list = isinstance(y, list)
+
+    if not x_is_list and not y_is_list:
+        try:
+            return op_func(x, y)
+        except ELEMENT_ERRORS as e:
+            errors.append(e)
+            return None
+
+    if not x_is_list:
+        x_values, y_values = itertools.repeat(x, len(y)), y
+    elif not y_is_list:
+        x_values, y_values = x, itertools.repeat(y, len(x))
+    elif lacing == "Cross":
+        return [elementwise(op_func, x_item, y, lacing, errors) for x_item in x]
+    elif lacing == "Shortest" or len(x) == len(y):
+        x_values, y_values = x, y
+    else:
+        x_values, y_values = broadcast_pair(x, y)
+
+    # Flat level in one pass, element by element if sub lists (min / max compare lists) or errors
+    x_values, y_values = list(x_values), list(y_values)
+    if not any(isinstance(item, list) for item in itertools.chain(x_values, y_values)):
+        try:
+            return list(map(op_func, x_values, y_values))
+        except (TypeError, *ELEMENT_ERRORS):
+            pass
+    return [elementwise(op_func, x_item, y_item, lacing, errors) for x_item, y_item in zip(x_values, y_values)]
+
+
+def broadcast_pair(x: list,
+                   y: list) -> tuple[Any, Any]:
+    """ Extend the shorter list by repeating its last value
+
+    Args:
+        x: first list
+        y: second list
+
+    Returns:
+        values of x, values of y (same length)
+    """
+    length = max(len(x), len(y))
+
+    def extend(values: list) -> Any:
+        if not values or len(values) == length:
+            return values
+        return itertools.chain(values, itertools.repeat(values[-1], length - len(values)))
+
+    return extend(x), extend(y)
+
+
 class NodeOperatorModulo(NodeBase):
     """ Definition of class OperatorModulo
     """
 
     def _create_output(self) -> None:
-        """ Calculate the modulo
+        """ Calculate the operation element by element
         """
+        self._set_init_node_output(self.build_ele.Result)
 
         x = self.build_ele.X.value
         y = self.build_ele.Y.value
+        operation = self.build_ele.Operation.value or "%"
+        lacing = self.build_ele.Lacing.value or "Longest"
 
         if x == []:
             self.warning = "X is empty"
@@ -42,8 +162,23 @@ class NodeOperatorModulo(NodeBase):
             self.error = "Y is empty"
             return
 
-        if y == 0:
-            self.error = "Can't divide by zero"
+        if operation not in OPERATIONS:
+            self.error = f"Unsupported operation: {operation}"
+            return
+
+        if lacing not in LACINGS:
+            self.error = f"Unsupported lacing: {lacing}"
+            return
+
+        errors = []
+        try:
+            result = elementwise(OPERATIONS[operation], x, y, lacing, errors)
+        except TypeError as e:
+            self.error = f"Invalid value: {e}"
             return
 
-        self.build_ele.Result.value = [item % y for item in x]
+        if errors:
+            self.warning = "\n".join(f"{name}: {count} value(s) set to None"
+                                     for name, count in Counter(type(e).__name__ for e in errors).items())
+
+        self.build_ele.Result.value = result
@@ -1,16 +1,31 @@
 """ Script for NodeCommandBlock
 """
 
+from __future__ import annotations
+
+import os
 import re
 import ast
+import mmap
 import math
 import random
 import operator
 
-from typing import Any
+from array           import array
+from enum            import Enum
+from typing          import Any, Callable, NamedTuple
+from fractions       import Fraction
+from functools       import lru_cache
+from itertools       import chain, repeat
+from collections.abc import Sequence
 
 from NodeUtil import NodeBase, NodeFunctionUtil
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 
 NodeBase.trace_node_name('NodeCommandBlock')
 
@@ -53,6 +68,656 @@ MATH_CONSTS = {
     "pi": math.pi
     }
 
+# Same functions for the evaluation over NumPy arrays
+NUMPY_FUNCS = {
+    "abs": np.fabs,
+    "sqrt": np.sqrt,
+    "pow": np.power,
+
+    "rad": np.radians,
+    "deg": np.degrees,
+
+    "sin": np.sin,
+    "cos": np.cos,
+    "tan": np.tan,
+    "asin": np.arcsin,
+    "acos": np.arccos,
+    "atan": np.arctan,
+
+    "log": lambda x, base= None: np.log(x) if base is None else np.log(x) / np.log(base),
+    "log10": np.log10,
+    "exp": np.exp,
+    } if np is not None else {}
+
+# Expression variables and their input port
+VARIABLES = {
+    "x": "X",
+    "y": "Y",
+    "r": "R",
+    }
+
+# Number of compiled expressions kept in memory
+EXPR_CACHE_SIZE = 1024
+
+# Number of parsed commands kept in memory (large enough for a batch of commands)
+PLAN_CACHE_SIZE = 1024
+
+# Regex pattern to detect a complete word from the authorized names (pi, sqrt, ...)
+ALLOWED_NAMES_PATTERN = re.compile(
+    fr"\b({'|'.join(re.escape(name) for name in (*MATH_FUNCS, *MATH_CONSTS))})\b"
+    )
+
+# Number of value files kept in memory
+FILE_CACHE_SIZE = 16
+
+FILE_PREFIX = "@file:"
+
+# Options written before a list command: [keep, unique] 3|1|2
+LIST_OPTIONS = {
+    "keep",     # keep the input order of numeric values
+    "sort",     # sort text values too
+    "unique",   # remove duplicated values
+    }
+
+OPTIONS_PATTERN = re.compile(r"\[([A-Za-z,\s]*)\]\s*(.*)", re.DOTALL)
+
+# Values of a file, separated by line breaks, commas, semicolons or tabs
+FILE_VALUE_PATTERN = re.compile(rb"[^\r\n,;\t]+")
+
+EXPR_CHARS_PATTERN = re.compile(r"[0-9a-zA-Z\.\s\+\-\*/%\(\),]+")
+DIGIT_PATTERN = re.compile(r"\d")
+OPERATOR_PATTERN = re.compile(r"[+\-*/%]")
+
+# Unique random values: drawn one by one into a set when the count is at most
+# 1/SPARSE_SAMPLE_RATIO of the grid (few collisions, no len() of huge ranges)
+SPARSE_SAMPLE_RATIO = 4
+
+
+class CommandKind(Enum):
+    """ Kinds of command of the CommandBlock language
+    """
+    SEQUENCE = "sequence"
+    LIST = "list"
+    FILE = "file"
+    RANDOM = "random"
+    EXPRESSION = "expression"
+    NUMBER = "number"
+    TEXT = "text"
+    ERROR = "error"
+
+
+class CommandPlan(NamedTuple):
+    """ Parsed command, ready to be executed
+
+    data depends on the kind of command:
+    - SEQUENCE:   sequence text
+    - LIST:       normalized items (array or tuple)
+    - FILE:       (file path, list options)
+    - RANDOM:     (is_float, min, max, count, precision, mode, seed)
+    - EXPRESSION: compiled expression
+    - NUMBER:     numeric value
+    - TEXT:       text value
+    - ERROR:      error message
+    """
+    kind: CommandKind
+    data: Any
+
+
+class CommandOutput(NamedTuple):
+    """ Outputs of an executed command
+    """
+    as_integer: int | None = None
+    as_double:  float | None = None
+    as_string:  str | None = None
+    as_list:    list | None = None
+
+
+class NumericSequence(Sequence):
+    """ Lazy arithmetic sequence, element i is start + i * step
+
+    Elements are computed on access with exact rational arithmetic, so there is
+    no drift along the sequence. Integral values are returned as int.
+    """
+    __slots__ = ("start", "step", "length")
+
+    def __init__(self,
+                 start:  Fraction,
+                 step:   Fraction,
+                 length: int) -> None:
+        """ Initialization of class NumericSequence
+
+        Args:
+            start:  first element of the sequence
+            step:   step between elements
+            length: number of elements
+        """
+        self.start = start
+        self.step = step
+        self.length = max(length, 0)
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __getitem__(self, index: int | slice) -> int | float | NumericSequence:
+        if isinstance(index, slice):
+            indices = range(self.length)[index]
+            return NumericSequence(self.start + indices.start * self.step,
+                                   self.step * indices.step,
+                                   len(indices))
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError("sequence index out of range")
+        return _exact_to_number(self.start + index * self.step)
+
+    def __iter__(self):
+        if self.step == 0:
+            return repeat(_exact_to_number(self.start), self.length)
+        if self.start.denominator == 1 and self.step.denominator == 1:
+            start = int(self.start)
+            step = int(self.step)
+            return iter(range(start, start + step * self.length, step))
+        return self._iter_exact()
+
+    def _iter_exact(self):
+        # Integer numerators over a common denominator, int / int is correctly rounded
+        denominator = math.lcm(self.start.denominator, self.step.denominator)
+        start = self.start.numerator * (denominator // self.start.denominator)
+        step = self.step.numerator * (denominator // self.step.denominator)
+        return (numerator // denominator if numerator % denominator == 0 else numerator / denominator
+                for numerator in range(start, start + step * self.length, step))
+
+    def __repr__(self) -> str:
+        return f"NumericSequence({self.start}, {self.step}, {self.length})"
+
+
+class AlphaSequence(Sequence):
+    """ Lazy sequence of letters (A, B, ..., Z, AA, ...) built over a sequence of numbers
+    """
+    __slots__ = ("numbers", "to_alpha")
+
+    def __init__(self,
+                 numbers:  Sequence,
+                 to_alpha: Callable[[int], str]) -> None:
+        """ Initialization of class AlphaSequence
+
+        Args:
+            numbers:  sequence of letter indices
+            to_alpha: converter from index to letters
+        """
+        self.numbers = numbers
+        self.to_alpha = to_alpha
+
+    def __len__(self) -> int:
+        return len(self.numbers)
+
+    def __getitem__(self, index: int | slice) -> str | AlphaSequence:
+        if isinstance(index, slice):
+            return AlphaSequence(self.numbers[index], self.to_alpha)
+        return self.to_alpha(round(self.numbers[index]))
+
+    def __iter__(self):
+        return (self.to_alpha(round(n)) for n in self.numbers)
+
+    def __repr__(self) -> str:
+        return f"AlphaSequence({self.numbers!r})"
+
+
+@lru_cache(maxsize= EXPR_CACHE_SIZE)
+def compile_expr(expr:       str,
+                 variables:  tuple[str, ...] = (),
+                 vectorized: bool = False) -> Callable[[Sequence], Any]:
+    """ Check an arithmetic expression against the authorized operators,
+    functions and constants, and compile it to a callable
+
+    The result is cached by expression text, so a formula is parsed only once.
+
+    Args:
+        expr:       string input
+        variables:  names of the variables usable in the expression
+        vectorized: compile for NumPy arrays instead of numbers
+
+    Returns:
+        callable evaluating the expression for the variable values (same order as variables)
+    """
+    try:
+        tree = ast.parse(expr, mode='eval')
+    except SyntaxError as e:
+        raise ValueError(f"Syntax error: {e}") from e
+
+    return _compile_node(tree.body, variables, NUMPY_FUNCS if vectorized else MATH_FUNCS)
+
+
+def _compile_node(node:      ast.AST,
+                  variables: tuple[str, ...],
+                  funcs:     dict[str, Callable]) -> Callable[[Sequence], Any]:
+    """ Compile an AST node to a callable
+
+    Args:
+        node:      AST node
+        variables: names of the variables
+        funcs:     authorized functions
+
+    Returns:
+        callable evaluating the node for the variable values
+    """
+    # Numerical constants (integer / float)
+    if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)):
+        value = node.value
+        return lambda env: value
+
+    # Binary operations
+    if isinstance(node, ast.BinOp):
+        op_type = type(node.op)
+        if op_type not in OPS:
+            raise ValueError(f"Operator {op_type} not allowed")
+        op_func = OPS[op_type]
+        left = _compile_node(node.left, variables, funcs)
+        right = _compile_node(node.right, variables, funcs)
+        return lambda env: op_func(left(env), right(env))
+
+    # Unary operations (+x / -x)
+    if isinstance(node, ast.UnaryOp):
+        op_type = type(node.op)
+        if op_type not in OPS:
+            raise ValueError(f"Unary operator {op_type} not allowed")
+        op_func = OPS[op_type]
+        operand = _compile_node(node.operand, variables, funcs)
+        return lambda env: op_func(operand(env))
+
+    # Mathematical operations : sqrt(x), pow(x, y), sin(x), cos(x), tan(x)
+    if isinstance(node, ast.Call):
+        if isinstance(node.func, ast.Name) and node.func.id in funcs:
+            func = funcs[node.func.id]
+            args = [_compile_node(arg, variables, funcs) for arg in node.args]
+            return lambda env: func(*[arg(env) for arg in args])
+        raise ValueError("Function not allowed")
+
+    # Mathematical constants : pi, and variables
+    if isinstance(node, ast.Name):
+        if node.id in MATH_CONSTS:
+            value = MATH_CONSTS[node.id]
+            return lambda env: value
+        if node.id in variables:
+            index = variables.index(node.id)
+            return lambda env: env[index]
+        raise ValueError("Unknown constant")
+
+    raise ValueError(f"Expression not allowed: {type(node)}")
+
+
+@lru_cache(maxsize= PLAN_CACHE_SIZE)
+def parse_command(text:      str,
+                  variables: tuple[str, ...] = ()) -> CommandPlan:
+    """ Classify a command and parse it into a command plan
+
+    The result is cached by command text, so a repeated command skips
+    the whole classification.
+
+    Args:
+        text:      stripped command
+        variables: names of the bound variables
+
+    Returns:
+        command plan
+    """
+    options, body = _split_options(text)
+    is_file = body[:len(FILE_PREFIX)].lower() == FILE_PREFIX
+    is_list = not is_file and ".." not in text and "|" in body
+
+    # Values from a file
+    if is_file:
+        path = body[len(FILE_PREFIX):].strip().strip("\"'")
+        return CommandPlan(CommandKind.FILE, (path, options))
+
+    # Sequence
+    if ".." in text:
+        return CommandPlan(CommandKind.SEQUENCE, text)
+
+    # List
+    if is_list:
+        return CommandPlan(CommandKind.LIST, compact_values(normalize_list(body.split("|"), options)))
+
+    # Random integers
+    if text.lower().startswith("rand(") and text.endswith(")"):
+        try:
+            return CommandPlan(CommandKind.RANDOM, _parse_rand_args(text[5:-1]))
+        except Exception as e:
+            return CommandPlan(CommandKind.ERROR, f"Random error: {e}")
+
+    # Random floats
+    if text.lower().startswith("randf(") and text.endswith(")"):
+        try:
+            return CommandPlan(CommandKind.RANDOM, _parse_randf_args(text[6:-1]))
+        except Exception as e:
+            return CommandPlan(CommandKind.ERROR, f"Random error: {e}")
+
+    # Simple arithmetic expression
+    if EXPR_CHARS_PATTERN.fullmatch(text):
+        has_math_name = ALLOWED_NAMES_PATTERN.search(text)
+        has_digit = DIGIT_PATTERN.search(text)
+        has_operator = OPERATOR_PATTERN.search(text)
+        has_variable = variables and re.search(fr"\b({'|'.join(variables)})\b", text)
+
+        if has_math_name or has_variable or (has_digit and has_operator):
+            try:
+                return CommandPlan(CommandKind.EXPRESSION, compile_expr(text, variables))
+            except Exception as e:
+                return CommandPlan(CommandKind.ERROR, f"Calcul error: {e}")
+
+        try:
+            return CommandPlan(CommandKind.NUMBER, float(text))
+        except ValueError:
+            pass
+
+    # Text
+    return CommandPlan(CommandKind.TEXT, text)
+
+
+def _parse_rand_args(text: str) -> tuple:
+    """ Parse the arguments of rand(min,max,count[,'raw'][,seed=N])
+
+    Args:
+        text: arguments between parentheses
+
+    Returns:
+        (is_float, min, max, count, precision, mode, seed)
+    """
+    args, seed = _split_seed([a.strip() for a in text.split(",")])
+    if len(args) not in (3, 4):
+        raise ValueError("rand(min,max,count) or rand(min,max,count[,'raw'])")
+    min_val = int(args[0])
+    max_val = int(args[1])
+    if min_val > max_val:
+        min_val, max_val = max_val, min_val
+    count = int(args[2])
+    mode = str(args[3]) if len(args) == 4 else "unique"
+    if mode == "unique":
+        if count > (max_val - min_val + 1):
+            raise ValueError("Count too large for unique integers in range")
+    elif mode != "raw":
+        raise ValueError(f"Unknown mode: {mode}")
+    return (False, min_val, max_val, count, 0, mode, seed)
+
+
+def _parse_randf_args(text: str) -> tuple:
+    """ Parse the arguments of randf(min,max,count[,precision, 'raw'][,seed=N])
+
+    Args:
+        text: arguments between parentheses
+
+    Returns:
+        (is_float, min, max, count, precision, mode, seed)
+    """
+    args, seed = _split_seed([a.strip() for a in text.split(",")])
+    if len(args) not in (3, 4, 5):
+        raise ValueError("randf(min,max,count[,precision]) or randf(min,max,count[,precision, 'raw'])")
+    min_val = float(args[0])
+    max_val = float(args[1])
+    if min_val > max_val:
+        min_val, max_val = max_val, min_val
+    count = int(args[2])
+    precision = int(args[3]) if len(args) >= 4 and args[3].isdigit() else 3
+    mode = str(args[4]) if len(args) == 5 else "unique"
+    if mode == "unique":
+        # Values are drawn from the grid of values with this precision
+        if count > _grid_size(_precision_grid(min_val, max_val, precision)):
+            raise ValueError(
+                f"Unable to generate {count} unique values"
+                f"with precision {precision} over the range {min_val}-{max_val}"
+            )
+    elif mode != "raw":
+        raise ValueError(f"Unknown mode: {mode}")
+    return (True, min_val, max_val, count, precision, mode, seed)
+
+
+def _split_seed(args: list[str]) -> tuple[list[str], int | None]:
+    """ Extract the optional seed=N argument of rand / randf
+
+    Args:
+        args: stripped arguments
+
+    Returns:
+        (other arguments, seed or None)
+    """
+    seed = None
+    positional = []
+    for arg in args:
+        if arg.lower().startswith("seed="):
+            seed = int(arg[5:])
+        else:
+            positional.append(arg)
+    return positional, seed
+
+
+def _precision_grid(min_val:   float,
+                    max_val:   float,
+                    precision: int) -> range:
+    """ Integer grid of the values with this precision in [min, max]
+
+    Value k of the grid is k / 10**precision.
+
+    Args:
+        min_val:   minimum value
+        max_val:   maximum value
+        precision: number of decimals
+
+    Returns:
+        range of grid indices
+    """
+    scale = 10 ** precision
+    return range(math.ceil(_to_exact(min_val) * scale), math.floor(_to_exact(max_val) * scale) + 1)
+
+
+def _grid_size(grid: range) -> int:
+    """ Number of values of a grid, len() is limited to sys.maxsize
+
+    Args:
+        grid: range of grid indices (step 1)
+
+    Returns:
+        number of values
+    """
+    return max(grid.stop - grid.start, 0)
+
+
+def _sample_grid(rng:   random.Random,
+                 grid:  range,
+                 count: int) -> list[int]:
+    """ Draw unique values of a grid, sorted
+
+    Args:
+        rng:   random generator
+        grid:  range of grid indices (step 1)
+        count: number of values
+
+    Returns:
+        sorted unique values
+    """
+    size = _grid_size(grid)
+    if 0 <= count and count * SPARSE_SAMPLE_RATIO <= size:
+        selected = set()
+        while len(selected) < count:
+            selected.add(rng.randrange(grid.start, grid.stop))
+        return sorted(selected)
+    return sorted(rng.sample(grid, count))
+
+
+def _split_options(text: str) -> tuple[frozenset[str], str]:
+    """ Split the options written before a command: [keep, unique] 3|1|2
+
+    Brackets with other words are part of the command: [a] b|c is the list ['[a] b', 'c'].
+
+    Args:
+        text: stripped command
+
+    Returns:
+        (lower case options, command without options)
+    """
+    match = OPTIONS_PATTERN.fullmatch(text)
+    if match is None:
+        return frozenset(), text
+    options = frozenset(opt.strip().lower() for opt in match.group(1).split(",") if opt.strip())
+    if not options or not options <= LIST_OPTIONS:
+        return frozenset(), text
+    return options, match.group(2)
+
+
+@lru_cache(maxsize= FILE_CACHE_SIZE)
+def load_value_file(path:    str,
+                    mtime:   int,
+                    size:    int,
+                    options: frozenset[str] = frozenset()) -> Sequence:
+    """ Read the values of a CSV / text file
+
+    The file is memory-mapped and its values are converted in a single typed pass.
+    The result is cached by path and modification time, so an unchanged file
+    is read only once.
+
+    Args:
+        path:    file path
+        mtime:   modification time of the file (cache key)
+        size:    size of the file (cache key)
+        options: list options (keep, sort, unique)
+
+    Returns:
+        homogeneous values (int, float or str) in a compact array or tuple
+    """
+    if size == 0:
+        return ()
+
+    with open(path, "rb") as file, mmap.mmap(file.fileno(), 0, access= mmap.ACCESS_READ) as data:
+        start = 3 if data[:3] == b"\xef\xbb\xbf" else 0
+        tokens = [token.decode("utf-8", errors= "replace").strip()
+                  for token in FILE_VALUE_PATTERN.findall(data, start)]
+
+    values, value_type = parse_values([token for token in tokens if token])
+    return compact_values(arrange_values(values, value_type, options))
+
+
+def parse_values(tokens: list[str]) -> tuple[list, type]:
+    """ Convert stripped strings to the narrowest common type (int, float, str) in one pass
+
+    Args:
+        tokens: stripped strings
+
+    Returns:
+        (converted values, common type)
+    """
+    values = []
+    convert = int
+    for token in tokens:
+        try:
+            values.append(convert(token))
+        except ValueError:
+            if convert is float:
+                return list(tokens), str
+            # Switch to float for all values
+            try:
+                values = [float(value) for value in values]
+                values.append(float(token))
+            except ValueError:
+                return list(tokens), str
+            convert = float
+    return values, convert
+
+
+def arrange_values(values:     list,
+                   value_type: type,
+                   options:    frozenset[str] = frozenset()) -> list:
+    """ Apply the list options to homogeneous values
+
+    By default numeric values are sorted and text values keep their order.
+
+    Args:
+        values:     homogeneous values (modified in place)
+        value_type: common type of the values
+        options:    list options (keep, sort, unique)
+
+    Returns:
+        arranged values
+    """
+    if "unique" in options:
+        values = list(dict.fromkeys(values))
+    if "sort" in options or (value_type is not str and "keep" not in options):
+        values.sort()
+    return values
+
+
+def compact_values(values: list) -> Sequence:
+    """ Store homogeneous values in a compact read-only sequence
+
+    Integers and floats are stored in an array('q') / array('d'),
+    text values in a tuple.
+
+    Args:
+        values: homogeneous values
+
+    Returns:
+        array or tuple
+    """
+    if values and type(values[0]) in (int, float):
+        try:
+            return array("q" if type(values[0]) is int else "d", values)
+        except OverflowError:
+            pass
+    return tuple(values)
+
+
+def normalize_list(seq:     list[str],
+                   options: frozenset[str] = frozenset()) -> list[int] | list[float] | list[str]:
+    """ Converts a list of strings into a homogeneous list (int, float, str)
+
+    Args:
+        seq:     user input
+        options: list options (keep, sort, unique)
+
+    Returns:
+        homogeneous list
+    """
+    values, value_type = parse_values([str(item).strip() for item in seq])
+    return arrange_values(values, value_type, options)
+
+
+def all_floats(values: tuple[Any, ...]) -> bool:
+    """ Check if the values are floats only (single values or lists)
+
+    Args:
+        values: values of the variables
+
+    Returns:
+        True / False
+    """
+    return all(set(map(type, value)) <= {float} if isinstance(value, list) else type(value) is float
+               for value in values)
+
+
+def _to_exact(value: Any) -> Fraction:
+    """ Convert a numeric value to an exact fraction of its decimal representation
+
+    Args:
+        value: numeric value or string
+
+    Returns:
+        exact value (0.1 -> 1/10)
+    """
+    value = float(value)
+    if not math.isfinite(value):
+        raise ValueError(f"bound must be finite, not {value}")
+    return Fraction(repr(value))
+
+
+def _exact_to_number(value: Fraction) -> int | float:
+    """ Convert an exact value to int if it is integral, float otherwise
+
+    Args:
+        value: exact value
+
+    Returns:
+        numeric value
+    """
+    return int(value) if value.denominator == 1 else float(value)
+
 
 def create_node(init_data):
     """ Create the node
@@ -70,6 +735,17 @@ class NodeCommandBlock(NodeBase):
     """ Definition of class NodeCommandBlock
     """
 
+    def __init__(self, init_data) -> None:
+        """ Initialization of class NodeCommandBlock
+
+        Args:
+            init_data:  data for the node initialization
+        """
+        super().__init__(init_data)
+
+        self.rng = random.Random()
+
+
     def _create_output(self) -> None:
         """ Execute instructions
         """
@@ -88,110 +764,165 @@ class NodeCommandBlock(NodeBase):
             self.error = "No instruction to execute"
             return
 
-        text = self.build_ele.Command.value.strip()
+        # Trailing blank lines are dropped, the other lines keep their number
+        lines = [line.strip() for line in self.build_ele.Command.value.rstrip().splitlines()]
+        commands = [line for line in lines if line]
+        if not commands:
+            self.error = "No instruction to execute"
+            return
+
+        variables = self.get_variables()
 
-        # Set of authorized names (functions and constants)
-        allowed_names = set(MATH_FUNCS.keys()) | set(MATH_CONSTS.keys())
+        # Single command
+        if len(commands) == 1:
+            output = self.execute_command(commands[0], variables)
+            self.build_ele.AsInteger.value = output.as_integer
+            self.build_ele.AsDouble.value = output.as_double
+            self.build_ele.AsString.value = output.as_string
+            self.build_ele.AsList.value = output.as_list
+            return
 
-        # Regex pattern to detect a complete word from these names (pi, sqrt, ...)
-        allowed_pattern = fr"\b({'|'.join(re.escape(name) for name in allowed_names)})\b"
+        # Batch mode: one command per line, one list per line (None for a blank line)
+        results = []
+        errors = []
+        for idx, line in enumerate(lines, 1):
+            if not line:
+                results.append(None)
+                continue
+            output = self.execute_command(line, variables)
+            results.append(output.as_list)
+            if output.as_list is None and output.as_string is not None:
+                errors.append(f"Line {idx}: {output.as_string}")
 
-        # Generate sequence
-        if ".." in text:
-            self.build_ele.AsList.value = self.create_sequence_from_text(text)
+        self.build_ele.AsList.value = results
+        if errors:
+            self.warning = "\n".join(errors)
 
-        # Create list
-        elif "|" in text:
-            items = text.split("|")
-            seq = self.normalize_list_type(items)
-            self.build_ele.AsList.value = seq
 
-        # Random integers
-        elif text.lower().startswith("rand(") and text.endswith(")"):
-            try:
-                args = [a.strip() for a in text[5:-1].split(",")]
-                if len(args) not in (3, 4):
-                    raise ValueError("rand(min,max,count) or rand(min,max,count[,'raw'])")
-                min_val = int(args[0])
-                max_val = int(args[1])
-                if min_val > max_val:
-                    min_val, max_val = max_val, min_val
-                count = int(args[2])
-                mode = str(args[3]) if len(args) == 4 else "unique"
-                if mode == "raw":
-                    seq = [random.randint(min_val, max_val) for _ in range(count)]
-                elif mode == "unique":
-                    if count > (max_val - min_val + 1):
-                        raise ValueError("Count too large for unique integers in range")
-                    seq = sorted(random.sample(range(min_val, max_val + 1), count))
-                else:
-                    raise ValueError(f"Unknown mode: {mode}")
-                self.build_ele.AsList.value = seq
-            except Exception as e:
-                self.build_ele.AsString.value = f"Random error: {e}"
+    def get_variables(self) -> dict[str, Any]:
+        """ Get the values of the connected variable inputs (X, Y, R)
+
+        Returns:
+            values by variable name
+        """
+        variables = {}
+        for name, port in VARIABLES.items():
+            value = getattr(self.build_ele, port).value
+            if value is not None and value != "" and value != []:
+                variables[name] = value
+        return variables
 
-        # Random floats
-        elif text.lower().startswith("randf(") and text.endswith(")"):
-            try:
-                args = [a.strip() for a in text[6:-1].split(",")]
-                if len(args) not in (3, 4, 5):
-                    raise ValueError("randf(min,max,count[,precision]) or randf(min,max,count[,precision, 'raw'])")
-                min_val = float(args[0])
-                max_val = float(args[1])
-                if min_val > max_val:
-                    min_val, max_val = max_val, min_val
-                count = int(args[2])
-                precision = int(args[3]) if len(args) >= 4 and args[3].isdigit() else 3
-                mode = str(args[4]) if len(args) == 5 else "unique"
-                if mode == "raw":
-                    seq = [round(random.uniform(min_val, max_val), precision) for _ in range(count)]
-                elif mode == "unique":
-                    # Avoid infinite loop if request is impossible
-                    max_unique_values = int((max_val - min_val) * (10 ** precision)) + 1
-                    if count > max_unique_values:
-                        raise ValueError(
-                            f"Unable to generate {count} unique values"
-                            f"with precision {precision} over the range {min_val}-{max_val}"
-                        )
-                    seen = set()
-                    while len(seen) < count:
-                        seen.add(round(random.uniform(min_val, max_val), precision))
-                    seq = sorted(seen)
-                else:
-                    raise ValueError(f"Unknown mode: {mode}")
-                self.build_ele.AsList.value = seq
-            except Exception as e:
-                self.build_ele.AsString.value = f"Random error: {e}"
 
-        # Simple arithmetic expression
-        elif re.fullmatch(r"[0-9a-zA-Z\.\s\+\-\*/%\(\),]+", text):
-            has_math_name = re.search(allowed_pattern, text)
-            has_digit = re.search(r"\d", text)
-            has_operator = re.search(r"[+\-*/%]", text)
+    def execute_command(self,
+                        text:      str,
+                        variables: dict[str, Any] | None = None) -> CommandOutput:
+        """ Execute a single command
 
-            if has_math_name or (has_digit and has_operator):
+        Args:
+            text:      stripped command
+            variables: values of the bound variables
+
+        Returns:
+            outputs of the command
+        """
+        variables = variables or {}
+        names = tuple(variables)
+        values = tuple(variables.values())
+
+        plan = parse_command(text, names)
+
+        match plan.kind:
+            # Generate sequence
+            case CommandKind.SEQUENCE:
                 try:
-                    result = self.calculate_expr(text)
-                    if isinstance(result, (int, float)):
-                        self.fill_numeric_output(result)
-                    else:
-                        self.build_ele.AsString.value = str(result)
-                        self.build_ele.AsList.value = [result]
+                    return CommandOutput(as_list= list(self.create_sequence_from_text(plan.data)))
                 except Exception as e:
-                    self.build_ele.AsString.value = f"Calcul error: {e}"
+                    return CommandOutput(as_string= f"Sequence error: {e}")
 
-            else:
+            # Create list
+            case CommandKind.LIST:
+                return CommandOutput(as_list= list(plan.data))
+
+            # Values from a file
+            case CommandKind.FILE:
                 try:
-                    val = float(text)
-                    self.fill_numeric_output(val)
-                except ValueError:
-                    self.build_ele.AsString.value = text
-                    self.build_ele.AsList.value = [text]
+                    path, options = plan.data
+                    stat = os.stat(path)
+                    values = load_value_file(path, stat.st_mtime_ns, stat.st_size, options)
+                    return CommandOutput(as_list= list(values))
+                except Exception as e:
+                    return CommandOutput(as_string= f"File error: {e}")
 
-        # Text
-        else:
-            self.build_ele.AsString.value = text
-            self.build_ele.AsList.value = [text]
+            # Random integers / floats
+            case CommandKind.RANDOM:
+                try:
+                    return CommandOutput(as_list= self.create_random(*plan.data))
+                except Exception as e:
+                    return CommandOutput(as_string= f"Random error: {e}")
+
+            # Simple arithmetic expression
+            case CommandKind.EXPRESSION:
+                try:
+                    if any(isinstance(value, list) for value in values):
+                        return CommandOutput(as_list= self.evaluate_vectorized(text, names, values))
+                    result = plan.data(values)
+                    if isinstance(result, (int, float)):
+                        return self.numeric_output(result)
+                    return CommandOutput(as_string= str(result), as_list= [result])
+                except Exception as e:
+                    return CommandOutput(as_string= f"Calcul error: {e}")
+
+            case CommandKind.NUMBER:
+                return self.numeric_output(plan.data)
+
+            case CommandKind.ERROR:
+                return CommandOutput(as_string= plan.data)
+
+            # Text
+            case _:
+                return CommandOutput(as_string= plan.data, as_list= [plan.data])
+
+
+    def create_random(self,
+                      is_float:  bool,
+                      min_val:   int | float,
+                      max_val:   int | float,
+                      count:     int,
+                      precision: int,
+                      mode:      str,
+                      seed:      int | None = None) -> list[int] | list[float]:
+        """ Generate random values from a parsed rand / randf command
+
+        Args:
+            is_float:  generate floats (randf) or integers (rand)
+            min_val:   minimum value
+            max_val:   maximum value
+            count:     number of values
+            precision: number of decimals (randf)
+            mode:      'raw' or 'unique'
+            seed:      seed for reproducible values, None for a new draw
+
+        Returns:
+            list of random values
+        """
+        rng = self.rng
+        if seed is not None:
+            rng.seed(seed)
+
+        if not is_float:
+            if mode == "raw":
+                return [rng.randint(min_val, max_val) for _ in range(count)]
+            return _sample_grid(rng, range(min_val, max_val + 1), count)
+
+        if mode == "raw":
+            return [round(rng.uniform(min_val, max_val), precision) for _ in range(count)]
+
+        if count <= 0:
+            return []
+
+        # Sample grid indices without replacement, O(count)
+        scale = 10 ** precision
+        return [k / scale for k in _sample_grid(rng, _precision_grid(min_val, max_val, precision), count)]
 
 
     def normalize_list_type(self,
@@ -204,94 +935,87 @@ class NodeCommandBlock(NodeBase):
         Returns:
             homogeneous list
         """
-        # Clean spaces
-        seq = [str(item).strip() for item in seq]
-
-        # Integer
-        try:
-            return sorted([int(v) for v in seq])
-        except ValueError:
-            pass
-
-        # Float
-        try:
-            return sorted([float(v) for v in seq])
-        except ValueError:
-            pass
+        return normalize_list(seq)
 
-        # String (default)
-        return seq
 
-
-    def fill_numeric_output(self,
-                            val: str) -> None:
+    def numeric_output(self,
+                       val: int | float) -> CommandOutput:
         """ Fill AsInteger / AsDouble / AsList depending on the numeric type
 
         Args:
-            val: user input
+            val: numeric value
+
+        Returns:
+            outputs of the command
         """
         if isinstance(val, int) or (isinstance(val, float) and val.is_integer()):
-            self.build_ele.AsInteger.value = int(val)
-            self.build_ele.AsDouble.value = float(val)
-            self.build_ele.AsList.value = [int(val)]
-        else:
-            self.build_ele.AsDouble.value = float(val)
-            self.build_ele.AsList.value = [float(val)]
+            return CommandOutput(as_integer= int(val), as_double= float(val), as_list= [int(val)])
+        return CommandOutput(as_double= float(val), as_list= [float(val)])
 
 
-    def calculate_expr(self, expr: str):
+    def calculate_expr(self,
+                       expr:      str,
+                       variables: dict[str, Any] | None = None):
         """ Safely evaluates an arithmetic expression.
 
         Args:
-            expr: string input
+            expr:      string input
+            variables: values of the variables used in the expression
         """
-        def eval_expr(node):
-            if isinstance(node, ast.Expression):
-                return eval_expr(node.body)
-
-            # Numerical constants (integer / float)
-            elif isinstance(node, ast.Constant) and isinstance(node.value, (int, float)):
-                return node.value
-
-            # Binary operations
-            elif isinstance(node, ast.BinOp):
-                op_type = type(node.op)
-                if op_type in OPS:
-                    return OPS[op_type](eval_expr(node.left), eval_expr(node.right))
-                raise ValueError(f"Operator {op_type} not allowed")
-
-            # Unary operations (+x / -x)
-            elif isinstance(node, ast.UnaryOp):
-                op_type = type(node.op)
-                if op_type in OPS:
-                    return OPS[op_type](eval_expr(node.operand))
-                raise ValueError(f"Unary operator {op_type} not allowed")
-
-            # Mathematical operations : sqrt(x), pow(x, y), sin(x), cos(x), tan(x)
-            elif isinstance(node, ast.Call):
-                if isinstance(node.func, ast.Name):
-                    fname = node.func.id
-                    if fname in MATH_FUNCS:
-                        args = [eval_expr(arg) for arg in node.args]
-                        return MATH_FUNCS[fname](*args)
-                raise ValueError("Function not allowed")
-
-            # Mathematical constants : pi
-            elif isinstance(node, ast.Name):
-                if node.id in MATH_CONSTS:
-                    return MATH_CONSTS[node.id]
-                raise ValueError("Unknown constant")
+        variables = variables or {}
+        return compile_expr(expr, tuple(variables))(tuple(variables.values()))
 
-            else:
-                raise ValueError(f"Expression not allowed: {type(node)}")
 
-        # Parse the expression and start the evaluation
-        try:
-            tree = ast.parse(expr, mode='eval')
-        except SyntaxError as e:
-            raise ValueError(f"Syntax error: {e}") from e
+    def evaluate_vectorized(self,
+                            expr:   str,
+                            names:  tuple[str, ...],
+                            values: tuple[Any, ...]) -> list:
+        """ Evaluates an expression elementwise over list variables
+
+        Shorter lists are extended with their last value, single values are
+        used for every element. NumPy is only used when all the values are floats,
+        integers are calculated exactly like a single value. A NumPy floating-point
+        error is calculated again element by element, so the error (or the complex
+        result) is the same as with the math module.
+
+        Args:
+            expr:   string input
+            names:  names of the variables
+            values: values of the variables (single value or list)
+
+        Returns:
+            list of results
+        """
+        length = max(len(value) for value in values if isinstance(value, list))
+        results = None
+
+        # NumPy: one evaluation over float64 arrays
+        if np is not None and all_floats(values):
+            env = []
+            for value in values:
+                if isinstance(value, list):
+                    column = np.empty(length)
+                    column[:len(value)] = value
+                    column[len(value):] = value[-1]
+                    env.append(column)
+                else:
+                    env.append(float(value))
+            try:
+                with np.errstate(all= "raise"):
+                    result = compile_expr(expr, names, True)(env)
+                results = np.broadcast_to(result, (length,)).tolist()
+            except FloatingPointError:
+                results = None
+
+        # Pure Python: one call of the compiled expression per element
+        if results is None:
+            func = compile_expr(expr, names)
+            columns = [chain(value, repeat(value[-1], length - len(value))) if isinstance(value, list)
+                       else repeat(value, length)
+                       for value in values]
+            results = [func(row) for row in zip(*columns)]
 
-        return eval_expr(tree.body)
+        return [int(val) if isinstance(val, float) and val.is_integer() else val for val in results]
 
 
     def is_number(self, value: Any) -> bool:
@@ -376,7 +1100,7 @@ class NodeCommandBlock(NodeBase):
                       start: str,
                       end: str,
                       step: int = 1,
-                      is_alpha: bool = False) -> list:
+                      is_alpha: bool = False) -> Sequence:
         """ Generate sequences:
         - start..end
         - start..end..step
@@ -388,33 +1112,29 @@ class NodeCommandBlock(NodeBase):
             is_alpha: check if sequence of letters or numbers
 
         Returns:
-            sequence as list
+            lazy sequence
         """
         if step == 0:
             raise ValueError("Step cannot be zero")
 
         direction = 1 if start < end else -1
-        step = abs(step) * direction
 
         if is_alpha:
+            step = abs(step) * direction
             limit = end + direction
-            return [self.num_to_alpha(n) for n in range(int(start), int(limit), int(step))]
+            return AlphaSequence(range(int(start), int(limit), int(step)), self.num_to_alpha)
 
-        seq = []
-        epsilon = 1e-9
-        current = start
-        while (direction == 1 and current <= end + epsilon) or \
-            (direction == -1 and current >= end - epsilon):
-            seq.append(int(current) if isinstance(current, float) and current.is_integer() else current)
-            current += step
-        return seq
+        start = _to_exact(start)
+        end = _to_exact(end)
+        step = abs(_to_exact(step)) * direction
+        return NumericSequence(start, step, math.floor((end - start) / step) + 1)
 
 
     def sequence_with_count(self,
                             start: str,
                             end: str,
                             count: int,
-                            is_alpha: bool = False) -> list:
+                            is_alpha: bool = False) -> Sequence:
         """ Generate sequences:
         - start..end..@count
         - start..@count..end
@@ -426,135 +1146,128 @@ class NodeCommandBlock(NodeBase):
             is_alpha: check if sequence of letters or numbers
 
         Returns:
-            sequence as list
+            lazy sequence
         """
-        if count == 1:
-            return [self.num_to_alpha(start)] if is_alpha else [int(start) if start.is_integer() else start]
+        if not is_alpha:
+            start = _to_exact(start)
+            end = _to_exact(end)
 
-        step = (end - start) / (count - 1) if count > 1 else 0
+        step = Fraction(end - start) / (count - 1) if count > 1 else Fraction(0)
+        seq_nums = NumericSequence(Fraction(start), step, count)
 
-        if is_alpha:
-            return [self.num_to_alpha(round(start + i * step)) for i in range(count)]
+        return AlphaSequence(seq_nums, self.num_to_alpha) if is_alpha else seq_nums
 
-        seq_nums = [start + i * step for i in range(count)]
-        return [int(x) if x.is_integer() else x for x in seq_nums]
 
-
-    def create_sequence_from_text(self, text: str) -> list:
+    def create_sequence_from_text(self, text: str) -> Sequence:
         """ Function to create sequence following:
         - start..end (step = 1)
         - start..end..step
         - start..end..@count
         - start..@count..end
 
+        An invalid text raises a ValueError, reported by the caller.
+
         Args:
             text: string
 
         Returns:
-            list of sequence
+            lazy sequence
         """
         result = []
 
-        try:
-            parts = text.split("..")
-            if len(parts) not in (2, 3):
-                raise ValueError("Syntax error: must contain 2 or 3 parts separated by '..'")
-
-            # Clean strings
-            parts_clean = list(map(self.clean_string, parts))
-
-            # Case 1 => 2 elements (step = 1)
-            if len(parts_clean) == 2:
-                start_str, end_str = parts_clean
-                if '@' in start_str or '@' in end_str:
-                    raise ValueError("Syntax error: '@' forbidden in start or end")
-                # Sequence of letters
-                if self.is_alpha(start_str) and self.is_alpha(end_str):
-                    return self.sequence_step(start= self.alpha_to_num(start_str),
-                                              end= self.alpha_to_num(end_str),
-                                              is_alpha= True
-                                              )
-                # Sequence of numbers
-                elif self.is_number(start_str) and self.is_number(end_str):
-                    return self.sequence_step(start= float(start_str),
-                                              end= float(end_str),
-                                              is_alpha= False
-                                              )
-                else:
-                    raise ValueError("Syntax error: start and end must both be alphabetic or numeric")
-
-            # Case 2 => 3 elements
+        parts = text.split("..")
+        if len(parts) not in (2, 3):
+            raise ValueError("Syntax error: must contain 2 or 3 parts separated by '..'")
+
+        # Clean strings
+        parts_clean = list(map(self.clean_string, parts))
+
+        # Case 1 => 2 elements (step = 1)
+        if len(parts_clean) == 2:
+            start_str, end_str = parts_clean
+            if '@' in start_str or '@' in end_str:
+                raise ValueError("Syntax error: '@' forbidden in start or end")
+            # Sequence of letters
+            if self.is_alpha(start_str) and self.is_alpha(end_str):
+                return self.sequence_step(start= self.alpha_to_num(start_str),
+                                          end= self.alpha_to_num(end_str),
+                                          is_alpha= True
+                                          )
+            # Sequence of numbers
+            elif self.is_number(start_str) and self.is_number(end_str):
+                return self.sequence_step(start= float(start_str),
+                                          end= float(end_str),
+                                          is_alpha= False
+                                          )
             else:
-                start_str, mid_str, end_str = parts_clean
+                raise ValueError("Syntax error: start and end must both be alphabetic or numeric")
 
-                # Case 2a or 2b: with '@count'
-                if mid_str.startswith("@") or end_str.startswith("@"):
+        # Case 2 => 3 elements
+        else:
+            start_str, mid_str, end_str = parts_clean
 
-                    count_str = None
-                    start_token = None
-                    end_token = None
+            # Case 2a or 2b: with '@count'
+            if mid_str.startswith("@") or end_str.startswith("@"):
 
-                    # Case 2a: start..@count..end
-                    if mid_str.startswith("@"):
-                        count_str = mid_str[1:]
-                        start_token = start_str
-                        end_token = end_str
+                count_str = None
+                start_token = None
+                end_token = None
 
-                    # Case 2b: start..end..@count
-                    elif end_str.startswith("@"):
-                        count_str = end_str[1:]
-                        start_token = start_str
-                        end_token = mid_str
+                # Case 2a: start..@count..end
+                if mid_str.startswith("@"):
+                    count_str = mid_str[1:]
+                    start_token = start_str
+                    end_token = end_str
 
-                    if count_str is None:
-                        raise ValueError("Syntax error: invalid '@count' syntax in sequence definition")
+                # Case 2b: start..end..@count
+                elif end_str.startswith("@"):
+                    count_str = end_str[1:]
+                    start_token = start_str
+                    end_token = mid_str
 
-                    if not count_str.isdigit():
-                        raise ValueError(f"Syntax error: '{count_str}' is not a valid number")
+                if count_str is None:
+                    raise ValueError("Syntax error: invalid '@count' syntax in sequence definition")
 
-                    count = int(count_str)
-                    if count < 1:
-                        raise ValueError("Syntax error: count must be at least 1")
+                if not count_str.isdigit():
+                    raise ValueError(f"Syntax error: '{count_str}' is not a valid number")
 
-                    # Sequence of letters
-                    if self.is_alpha(start_token) and self.is_alpha(end_token):
-                        start = self.alpha_to_num(start_token)
-                        end = self.alpha_to_num(end_token)
-                        seq = self.sequence_with_count(start, end, count, True)
-                        result.extend(seq)
-
-                    # Sequence of numbers
-                    elif self.is_number(start_token) and self.is_number(end_token):
-                        start = float(start_token)
-                        end = float(end_token)
-                        seq = self.sequence_with_count(start, end, count, False)
-                        result.extend(seq)
-
-                # Case 2c: start..end..step
-                else:
+                count = int(count_str)
+                if count < 1:
+                    raise ValueError("Syntax error: count must be at least 1")
+
+                # Sequence of letters
+                if self.is_alpha(start_token) and self.is_alpha(end_token):
+                    start = self.alpha_to_num(start_token)
+                    end = self.alpha_to_num(end_token)
+                    return self.sequence_with_count(start, end, count, True)
+
+                # Sequence of numbers
+                elif self.is_number(start_token) and self.is_number(end_token):
+                    start = float(start_token)
+                    end = float(end_token)
+                    return self.sequence_with_count(start, end, count, False)
+
+            # Case 2c: start..end..step
+            else:
+                # Sequence of letters
+                if self.is_alpha(start_str) and self.is_alpha(mid_str) and self.is_number(end_str):
                     # Sequence of letters
                     if self.is_alpha(start_str) and self.is_alpha(mid_str) and self.is_number(end_str):
-                        # Sequence of letters
-                        if self.is_alpha(start_str) and self.is_alpha(mid_str) and self.is_number(end_str):
-                            return self.sequence_step(self.alpha_to_num(start_str),
-                                                      self.alpha_to_num(mid_str),
-                                                      int(end_str),
-                                                      True
-                                                      )
-
-                    # Sequence of numbers
-                    elif self.is_number(start_str) and self.is_number(mid_str) and self.is_number(end_str):
-                        return self.sequence_step(float(start_str),
-                                                  float(mid_str),
-                                                  float(end_str),
-                                                  False
+                        return self.sequence_step(self.alpha_to_num(start_str),
+                                                  self.alpha_to_num(mid_str),
+                                                  int(end_str),
+                                                  True
                                                   )
 
-                    else:
-                        raise ValueError("Syntax error: start..end..step must be either all alphabetic or all numeric")
+                # Sequence of numbers
+                elif self.is_number(start_str) and self.is_number(mid_str) and self.is_number(end_str):
+                    return self.sequence_step(float(start_str),
+                                              float(mid_str),
+                                              float(end_str),
+                                              False
+                                              )
 
-        except Exception as e:
-            print(f"Erreur : {e}")
-            return None
+                else:
+                    raise ValueError("Syntax error: start..end..step must be either all alphabetic or all numeric")
 
         return result
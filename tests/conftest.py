@@ -0,0 +1,35 @@
+""" Test setup: the stand-in Allplan modules and the folders of the node scripts are importable
+"""
+
+import sys
+
+from pathlib import Path
+from typing  import Any
+
+import pytest
+
+TESTS_DIR = Path(__file__).parent
+NODES_DIR = TESTS_DIR.parent / "VisualScripts" / "ALLPLAN FRANCE"
+
+sys.path.insert(0, str(TESTS_DIR / "stubs"))
+
+for folder in sorted(NODES_DIR.iterdir()):
+    if folder.is_dir() and not folder.name.startswith(("_", ".")):
+        sys.path.insert(0, str(folder))
+
+
+@pytest.fixture
+def run_node():
+    """ Run a node with the given parameter values
+
+    Returns:
+        function (node class, parameter values) -> node after _create_output
+    """
+    def run(node_class: type, **values: Any) -> Any:
+        node = node_class(None)
+        for name, value in values.items():
+            getattr(node.build_ele, name).value = value
+        node._create_output()
+        return node
+
+    return run
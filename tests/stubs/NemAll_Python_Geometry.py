@@ -0,0 +1,108 @@
+""" Stand-in for NemAll_Python_Geometry: Point3D, Vector3D and Matrix3D with the
+operators used by the node scripts, in pure Python
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+
+class Coordinates:
+    """ Base of Point3D and Vector3D
+    """
+
+    def __init__(self, *args: Any):
+        if len(args) == 1:
+            args = (args[0].X, args[0].Y, args[0].Z)
+        elif not args:
+            args = (0.0, 0.0, 0.0)
+        self.X, self.Y, self.Z = (float(value) for value in args)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.X}, {self.Y}, {self.Z})"
+
+    def __eq__(self, other: Any) -> bool:
+        return type(self) is type(other) and (self.X, self.Y, self.Z) == (other.X, other.Y, other.Z)
+
+    __hash__ = None
+
+    def scaled(self, factor: float) -> Coordinates:
+        return type(self)(self.X * factor, self.Y * factor, self.Z * factor)
+
+
+class Point3D(Coordinates):
+    """ Stand-in for Point3D
+    """
+
+    def __add__(self, other: Any) -> Any:
+        if isinstance(other, (Point3D, Vector3D)):
+            return Point3D(self.X + other.X, self.Y + other.Y, self.Z + other.Z)
+        return NotImplemented
+
+    def __sub__(self, other: Any) -> Any:
+        if isinstance(other, Point3D):
+            return Vector3D(self.X - other.X, self.Y - other.Y, self.Z - other.Z)
+        if isinstance(other, Vector3D):
+            return Point3D(self.X - other.X, self.Y - other.Y, self.Z - other.Z)
+        return NotImplemented
+
+    def __mul__(self, other: Any) -> Any:
+        if isinstance(other, float):
+            return self.scaled(other)
+        if isinstance(other, Matrix3D):
+            return Point3D(*other.transform(self.X, self.Y, self.Z, 1.0))
+        return NotImplemented
+
+    def __truediv__(self, other: Any) -> Any:
+        if isinstance(other, float):
+            return self.scaled(1.0 / other)
+        return NotImplemented
+
+
+class Vector3D(Coordinates):
+    """ Stand-in for Vector3D
+    """
+
+    def __add__(self, other: Any) -> Any:
+        if isinstance(other, Vector3D):
+            return Vector3D(self.X + other.X, self.Y + other.Y, self.Z + other.Z)
+        return NotImplemented
+
+    def __sub__(self, other: Any) -> Any:
+        if isinstance(other, Vector3D):
+            return Vector3D(self.X - other.X, self.Y - other.Y, self.Z - other.Z)
+        return NotImplemented
+
+    def __mul__(self, other: Any) -> Any:
+        if isinstance(other, float):
+            return self.scaled(other)
+        if isinstance(other, Vector3D):
+            return self.X * other.X + self.Y * other.Y + self.Z * other.Z
+        if isinstance(other, Matrix3D):
+            return Vector3D(*other.transform(self.X, self.Y, self.Z, 0.0))
+        return NotImplemented
+
+    def __truediv__(self, other: Any) -> Any:
+        if isinstance(other, float):
+            return self.scaled(1.0 / other)
+        return NotImplemented
+
+
+class Matrix3D:
+    """ Stand-in for Matrix3D, 4x4 affine matrix
+    """
+
+    def __init__(self, rows: list | None = None):
+        self.rows = ([[float(i == j) for j in range(4)] for i in range(4)] if rows is None else
+                     [[float(value) for value in row] for row in rows])
+
+    def transform(self, x: float, y: float, z: float, w: float) -> tuple:
+        return tuple(row[0] * x + row[1] * y + row[2] * z + row[3] * w for row in self.rows[:3])
+
+
+class Polyhedron3D:
+    """ Stand-in for Polyhedron3D
+    """
+
+
+Point3D.__module__ = Vector3D.__module__ = Matrix3D.__module__ = Polyhedron3D.__module__ = __name__
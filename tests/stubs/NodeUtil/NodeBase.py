@@ -0,0 +1,61 @@
+""" Stand-in for NodeUtil.NodeBase
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+
+class NodeParameter:
+    """ Parameter of a node, only the value is used by the node scripts
+    """
+
+    def __init__(self, value: Any = None):
+        """ Initialization
+
+        Args:
+            value: value of the parameter
+        """
+        self.value = value
+
+
+class BuildElement:
+    """ Parameters of a node, a parameter is created with a None value when it is first read
+    """
+
+    def __getattr__(self, name: str) -> NodeParameter:
+        parameter = NodeParameter()
+        setattr(self, name, parameter)
+        return parameter
+
+
+class NodeBase:
+    """ Stand-in for NodeBase
+    """
+
+    def __init__(self, init_data: Any = None):
+        """ Initialization
+
+        Args:
+            init_data: data for the node initialization (unused)
+        """
+        self.build_ele = BuildElement()
+        self.error     = ""
+        self.warning   = ""
+
+
+    @staticmethod
+    def trace_node_name(name: str):
+        """ Trace the name of the node (unused)
+
+        Args:
+            name: name of the node
+        """
+
+
+    def _set_init_node_output(self, parameter: NodeParameter):
+        """ Initialize an output (unused)
+
+        Args:
+            parameter: output parameter
+        """
@@ -0,0 +1,7 @@
+""" Stand-in for NodeUtil.NodeInitData
+"""
+
+
+class NodeInitData:
+    """ Stand-in for NodeInitData
+    """
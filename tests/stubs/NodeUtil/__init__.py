@@ -0,0 +1,9 @@
+""" Stand-in for the NodeUtil package of Allplan, enough to run the node scripts
+"""
+
+from .NodeBase import NodeBase
+
+
+class NodeFunctionUtil:
+    """ Stand-in for NodeFunctionUtil
+    """
@@ -0,0 +1,174 @@
+""" Regression corpus of the CommandBlock node
+"""
+
+import pytest
+
+from NodeCommandBlock import NodeCommandBlock
+
+
+# (command, AsInteger, AsDouble, AsString, AsList)
+# Same results as the first version of the node, except:
+# - '0..1..0.1' and the other decimal sequences end exactly on their bound
+# - an invalid sequence gives 'Sequence error: ...' instead of no output
+CORPUS = [
+    ("42", 42, 42.0, None, [42]),
+    ("3.14", None, 3.14, None, [3.14]),
+    ("hello", None, None, "hello", ["hello"]),
+    ("5+5", 10, 10.0, None, [10]),
+    ("sqrt(9)", 3, 3.0, None, [3]),
+    ("cos(pi)", -1, -1.0, None, [-1]),
+    ("cos(rad(60))", None, 0.5000000000000001, None, [0.5000000000000001]),
+    ("deg(acos(0.5))", None, 60.00000000000001, None, [60.00000000000001]),
+    ("toto|tata|titi", None, None, None, ["toto", "tata", "titi"]),
+    ("3|1|2", None, None, None, [1, 2, 3]),
+    ("1.5|2|0.5", None, None, None, [0.5, 1.5, 2.0]),
+    (" a | b ", None, None, None, ["a", "b"]),
+    ("1|2|x", None, None, None, ["1", "2", "x"]),
+    ("[keep, unique] 3|1|3|2", None, None, None, [3, 1, 2]),
+    ("[sort] toto|tata|titi", None, None, None, ["tata", "titi", "toto"]),
+    ("[a] b|c", None, None, None, ["[a] b", "c"]),
+    ("[keep, foo] 3|1", None, None, None, ["[keep, foo] 3", "1"]),
+    ("[] a|b", None, None, None, ["[] a", "b"]),
+    ("1..5", None, None, None, [1, 2, 3, 4, 5]),
+    ("10..0..2", None, None, None, [10, 8, 6, 4, 2, 0]),
+    ("A..E", None, None, None, ["A", "B", "C", "D", "E"]),
+    ("A..Z..@6", None, None, None, ["A", "F", "K", "P", "U", "Z"]),
+    ("0..1..0.1", None, None, None, [0, 0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1]),
+    ("1..10..@4", None, None, None, [1, 4, 7, 10]),
+    ("1..@4..10", None, None, None, [1, 4, 7, 10]),
+    ("5..1", None, None, None, [5, 4, 3, 2, 1]),
+    ("Z..A", None, None, None, [chr(code) for code in range(ord("Z"), ord("A") - 1, -1)]),
+    ("A..K..3", None, None, None, ["A", "D", "G", "J"]),
+    ("1..1", None, None, None, [1]),
+    ("0.5..2.5..0.5", None, None, None, [0.5, 1, 1.5, 2, 2.5]),
+    ("0..-1..0.25", None, None, None, [0, -0.25, -0.5, -0.75, -1]),
+    ("A..Z..@1", None, None, None, ["A"]),
+    ("3..3..@1", None, None, None, [3]),
+    ("10..0..@3", None, None, None, [10, 5, 0]),
+    ("x..5", None, None, "Sequence error: Syntax error: start and end must both be alphabetic or numeric", None),
+    ("1..2..3..4", None, None, "Sequence error: Syntax error: must contain 2 or 3 parts separated by '..'", None),
+    ("1..5..@0", None, None, "Sequence error: Syntax error: count must be at least 1", None),
+    ("1..3..0", None, None, "Sequence error: Step cannot be zero", None),
+    ("2**10", 1024, 1024.0, None, [1024]),
+    ("7%3", 1, 1.0, None, [1]),
+    ("1/3", None, 0.3333333333333333, None, [0.3333333333333333]),
+    ("1/0", None, None, "Calcul error: division by zero", None),
+    ("pi", None, 3.141592653589793, None, [3.141592653589793]),
+    ("pi*2", None, 6.283185307179586, None, [6.283185307179586]),
+    ("sqrt(-1)", None, None, "Calcul error: math domain error", None),
+    ("abs(-3)", 3, 3.0, None, [3]),
+    ("foo(3)", None, None, "foo(3)", ["foo(3)"]),
+    ("pow(2, 0.5)", None, 1.4142135623730951, None, [1.4142135623730951]),
+    ("-3", -3, -3.0, None, [-3]),
+    ("+4", 4, 4.0, None, [4]),
+    ("log(exp(2))", 2, 2.0, None, [2]),
+    ("1e3", 1000, 1000.0, None, [1000]),
+    ("1e3+1", 1001, 1001.0, None, [1001]),
+    ("(1+2)*3", 9, 9.0, None, [9]),
+    ("sin", None, None, "Calcul error: Unknown constant", None),
+    ("hello world", None, None, "hello world", ["hello world"]),
+    ("a,b", None, None, "a,b", ["a,b"]),
+    ("abc def", None, None, "abc def", ["abc def"]),
+    ("1.5", None, 1.5, None, [1.5]),
+    ]
+
+# (command, error message) of the invalid random commands
+RANDOM_ERRORS = [
+    ("rand(1,10,20)", "Random error: Count too large for unique integers in range"),
+    ("rand(1,2)", "Random error: rand(min,max,count) or rand(min,max,count[,'raw'])"),
+    ("rand(5,1,-1)", "Random error: Sample larger than population or is negative"),
+    ("rand(1,3,2,'raw')", "Random error: Unknown mode: 'raw'"),
+    ("randf(0,0.01,5,2)", "Random error: Unable to generate 5 unique values"),
+    ]
+
+# (command, count, min, max, decimals, unique) of the valid random commands
+RANDOM_VALUES = [
+    ("RAND(1,5,3)", 3, 1, 5, 0, True),
+    ("rand(1,100,5,raw)", 5, 1, 100, 0, False),
+    ("randf(0,1,5,x)", 5, 0, 1, 3, True),
+    ("randf(0,1,3,2,raw)", 3, 0, 1, 2, False),
+    ("randf(1,2,4,1)", 4, 1, 2, 1, True),
+    ("randf(0,1,-2)", 0, 0, 1, 3, True),
+    ]
+
+
+@pytest.mark.parametrize("command, as_integer, as_double, as_string, as_list", CORPUS)
+def test_corpus(run_node, command, as_integer, as_double, as_string, as_list):
+    node = run_node(NodeCommandBlock, Command= command)
+
+    assert node.build_ele.AsInteger.value == as_integer
+    assert node.build_ele.AsDouble.value == as_double
+    assert node.build_ele.AsString.value == as_string
+    assert node.build_ele.AsList.value == as_list
+
+
+@pytest.mark.parametrize("command, message", RANDOM_ERRORS)
+def test_random_errors(run_node, command, message):
+    node = run_node(NodeCommandBlock, Command= command)
+
+    assert node.build_ele.AsString.value.startswith(message)
+    assert node.build_ele.AsList.value is None
+
+
+@pytest.mark.parametrize("command, count, min_val, max_val, decimals, unique", RANDOM_VALUES)
+def test_random_values(run_node, command, count, min_val, max_val, decimals, unique):
+    values = run_node(NodeCommandBlock, Command= command).build_ele.AsList.value
+
+    assert len(values) == count
+    assert all(min_val <= value <= max_val and round(value, decimals) == value for value in values)
+    if unique:
+        assert values == sorted(set(values))
+
+
+def test_random_seed(run_node):
+    first = run_node(NodeCommandBlock, Command= "randf(0,1,5,2,seed=7)").build_ele.AsList.value
+    second = run_node(NodeCommandBlock, Command= "randf(0,1,5,2,seed=7)").build_ele.AsList.value
+
+    assert first == second
+
+
+def test_random_large_grid(run_node):
+    values = run_node(NodeCommandBlock, Command= "randf(0,1e10,3,10)").build_ele.AsList.value
+
+    assert len(set(values)) == 3
+
+
+def test_batch_line_numbers(run_node):
+    node = run_node(NodeCommandBlock, Command= "1+1\n\n1/0")
+
+    assert node.build_ele.AsList.value == [[2], None, None]
+    assert node.warning == "Line 3: Calcul error: division by zero"
+
+
+@pytest.mark.parametrize("command", ["0..inf", "nan..3..@4"])
+def test_sequence_not_finite(run_node, command):
+    node = run_node(NodeCommandBlock, Command= command)
+
+    assert node.build_ele.AsString.value.startswith("Sequence error: bound must be finite")
+
+
+def test_expression_large_integers(run_node):
+    node = run_node(NodeCommandBlock, Command= "x+1", X= [2**53 + 1])
+
+    assert node.build_ele.AsList.value == [2**53 + 2]
+
+
+def test_sequence_exact_iteration(run_node):
+    values = run_node(NodeCommandBlock, Command= "0..1000..0.1").build_ele.AsList.value
+
+    assert values == [k // 10 if k % 10 == 0 else k / 10 for k in range(10001)]
+    assert all(type(value) is int for value in values[::10])
+
+
+@pytest.mark.parametrize("command, values", [
+    ("sqrt(x)", [4, -1]),
+    ("log(x)", [1, 0]),
+    ("x**0.5", [4, -1]),
+    ("exp(x)", [1, 1000]),
+    ])
+def test_expression_same_errors_for_int_and_float(run_node, command, values):
+    as_int = run_node(NodeCommandBlock, Command= command, X= values)
+    as_float = run_node(NodeCommandBlock, Command= command, X= [float(value) for value in values])
+
+    assert as_float.build_ele.AsString.value == as_int.build_ele.AsString.value
+    assert as_float.build_ele.AsList.value == as_int.build_ele.AsList.value
@@ -0,0 +1,39 @@
+""" Outputs of the ListSplitByBool node
+"""
+
+import pytest
+
+from NodeListSplitByBool import NodeListSplitByBool
+
+
+ITEMS = ["A", "B", "C", "D", "E"]
+
+
+@pytest.mark.parametrize("output_indices, if_true, if_false", [
+    (False, ["A", "C"], ["B", "D", "E"]),
+    (True, [0, 2], [1, 3, 4]),
+    ])
+def test_split(run_node, output_indices, if_true, if_false):
+    node = run_node(NodeListSplitByBool, ListToSplit= ITEMS, BoolMask= [1, 0, True, False], OutputIndices= output_indices)
+
+    assert node.build_ele.ListIfTrue.value == if_true
+    assert node.build_ele.ListIfFalse.value == if_false
+
+
+@pytest.mark.parametrize("output_indices, groups", [
+    (False, [["A", "C"], ["B"], ["D"], ["E"]]),
+    (True, [[0, 2], [1], [3], [4]]),
+    ])
+def test_split_by_key(run_node, output_indices, groups):
+    node = run_node(NodeListSplitByBool, ListToSplit= ITEMS, BoolMask= [2, 1, 2, 3], GroupByKey= True,
+                    OutputIndices= output_indices)
+
+    assert node.build_ele.Keys.value == [2, 1, 3, None]
+    assert node.build_ele.Groups.value == groups
+
+
+def test_indices_without_mask(run_node):
+    node = run_node(NodeListSplitByBool, ListToSplit= ITEMS, OutputIndices= True)
+
+    assert node.build_ele.ListIfTrue.value == []
+    assert node.build_ele.ListIfFalse.value == [0, 1, 2, 3, 4]
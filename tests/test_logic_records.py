@@ -0,0 +1,50 @@
+""" Records passed from the Case / LoopOperation nodes to the MatchCase / LoopFor nodes
+"""
+
+import pytest
+
+from LogicRecords import CaseRecord, IntervalRecord, LoopRecord, as_case_record, as_loop_record
+from NodeCase import NodeCase
+from NodeLoopOperation import NodeLoopOperation
+from NodeMatchCase import NodeMatchCase
+from NodeLoopFor import NodeLoopFor
+
+
+def test_case_output_is_marker_list(run_node):
+    case = run_node(NodeCase, MatchValue= "[0, 20[", Function= "low").build_ele.Result.value
+
+    assert isinstance(case, CaseRecord) and isinstance(case, list)
+    assert case[0] == "__MATCH_CASE_CASELIST__" and case.function == "low"
+    assert isinstance(case.match_value, IntervalRecord)
+
+
+def test_loop_operation_output_is_marker_list(run_node):
+    record = run_node(NodeLoopOperation, InitValue= 1, Operation= "+", Operand= 2).build_ele.Result.value
+
+    assert record == ["__LOOP_RETURN__", 1, "+", 2]
+    assert (record.init_value, record.operation, record.operand) == (1, "+", 2)
+
+
+@pytest.mark.parametrize("copy", [lambda record: record, list])
+def test_match_case_reads_copied_cases(run_node, copy):
+    cases = [copy(run_node(NodeCase, MatchValue= match_value, Function= function).build_ele.Result.value)
+             for match_value, function in [("0..10", "small"), (42, "answer")]]
+
+    node = run_node(NodeMatchCase, Value= [5, 42, 99], Cases= cases, Default= "other")
+
+    assert node.build_ele.Result.value == ["small", "answer", "other"]
+
+
+@pytest.mark.parametrize("copy", [lambda record: record, list])
+def test_loop_for_reads_copied_operation(run_node, copy):
+    record = copy(run_node(NodeLoopOperation, InitValue= 1, Operation= "*", Operand= 2).build_ele.Result.value)
+
+    node = run_node(NodeLoopFor, Repeat= 4, Function= record)
+
+    assert node.build_ele.Result.value == [2, 4, 8, 16]
+
+
+@pytest.mark.parametrize("item", [None, 3, [], ["__MATCH_CASE_CASELIST__", 1], ["x", 1, 2]])
+def test_not_records(item):
+    assert as_case_record(item) is None
+    assert as_loop_record(item) is None
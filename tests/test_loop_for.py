@@ -0,0 +1,127 @@
+""" Tests of the LoopFor node with stand-in geometry
+"""
+
+import math
+import tracemalloc
+
+import pytest
+
+import NemAll_Python_Geometry as Geometry
+import NodeLoopFor
+
+from NodeLoopFor import NodeLoopFor as LoopFor, ChainCache
+
+
+def loop(init_value, operation, operand):
+    return ["__LOOP_RETURN__", init_value, operation, operand]
+
+
+def test_cache_size_counts_coordinates():
+    cache = ChainCache(100)
+    cache.put("numbers", [1.0] * 50)
+    cache.put("points", [(1.0, 2.0, 3.0)] * 11)
+
+    assert cache.count == 11 * NodeLoopFor.COORDS_SIZE
+    assert cache.get("numbers") is None
+    assert cache.get("points") == [(1.0, 2.0, 3.0)] * 11
+
+
+def test_cache_skips_larger_chains():
+    cache = ChainCache(100)
+    cache.put("points", [(0.0, 0.0, 0.0)] * 25)
+
+    assert cache.get("points") is None
+    assert cache.count == 0
+
+
+def test_cache_resumes_chain(run_node):
+    first = run_node(LoopFor, Repeat= 5, Function= loop(Geometry.Point3D(0, 0, 0), "+", Geometry.Vector3D(1, 0, 0)))
+    second = run_node(LoopFor, Repeat= 8, Function= loop(Geometry.Point3D(0, 0, 0), "+", Geometry.Vector3D(1, 0, 0)))
+
+    assert [point.X for point in first.build_ele.Result.value] == [1, 2, 3, 4, 5]
+    assert [point.X for point in second.build_ele.Result.value] == [1, 2, 3, 4, 5, 6, 7, 8]
+
+
+def rotation(angle):
+    cos, sin = math.cos(angle), math.sin(angle)
+    return Geometry.Matrix3D([[cos, -sin, 0, 1], [sin, cos, 0, 2], [0, 0, 1, 0.5], [0, 0, 0, 1]])
+
+
+def step_by_step(init_value, operation, operands):
+    values = []
+    for operand in operands:
+        init_value = {"+": init_value.__add__, "-": init_value.__sub__,
+                      "*": init_value.__mul__, "/": init_value.__truediv__}[operation](operand)
+        values.append(init_value)
+    return values
+
+
+MATRIX = rotation(0.3)
+
+GEOMETRY_CHAINS = [
+    (Geometry.Point3D(1, 2, 3), "+", [Geometry.Vector3D(10, 20, 30)] * 6),
+    (Geometry.Point3D(1, 2, 3), "-", [Geometry.Vector3D(1, 1, 1)] * 6),
+    (Geometry.Point3D(1, 0, 0), "+", [Geometry.Vector3D(1, 0, 0), Geometry.Vector3D(0, 1, 0)] * 3),
+    (Geometry.Vector3D(2, 3, 4), "+", [Geometry.Vector3D(1, 0, 0)] * 6),
+    (Geometry.Point3D(2, 3, 4), "*", [2.0] * 6),
+    (Geometry.Vector3D(2, 3, 4), "/", [2.0] * 6),
+    (Geometry.Point3D(1, 0, 0), "*", [MATRIX] * 6),
+    (Geometry.Vector3D(1, 0, 0), "*", [MATRIX] * 6),
+    ]
+
+
+@pytest.mark.parametrize("init_value, operation, operands", GEOMETRY_CHAINS)
+def test_geometry_chain_on_coordinates(init_value, operation, operands):
+    values = LoopFor(None).accumulate_geom_chain(init_value, operation, operands, len(operands))
+    expected = step_by_step(init_value, operation, operands)
+
+    assert [type(value) for value in values] == [type(value) for value in expected]
+    for value, reference in zip(values, expected):
+        assert (value.X, value.Y, value.Z) == pytest.approx((reference.X, reference.Y, reference.Z))
+
+
+def test_geometry_chain_type_checked_first(monkeypatch):
+    calls = []
+    monkeypatch.setattr(LoopFor, "accumulate_coord", lambda self, *args: calls.append(args))
+
+    node = LoopFor(None)
+    result = node.accumulate_geom_chain(Geometry.Point3D(1, 2, 3), "-", Geometry.Point3D(1, 1, 1), 1000)
+
+    assert result is None
+    assert calls == []
+
+
+def traced_duplicate(run_node, copy_objects):
+    tracemalloc.start()
+    node = run_node(LoopFor, Repeat= 10_000, Function= loop(Geometry.Point3D(1, 2, 3), "", None), CopyObjects= copy_objects)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return node.build_ele.Result.value, peak
+
+
+def test_duplicate_without_copy(run_node):
+    copies, copies_peak = traced_duplicate(run_node, True)
+    shared, shared_peak = traced_duplicate(run_node, False)
+
+    assert len(shared) == len(copies) == 10_000
+    assert len({id(point) for point in copies}) == 10_000
+    assert all(point is shared[0] for point in shared)
+    assert shared_peak * 5 < copies_peak
+
+
+@pytest.mark.parametrize("init_value", [Geometry.Point3D(1, 0, 0), Geometry.Vector3D(1, 2, 3)])
+def test_matrix_powers_reference(init_value):
+    np = pytest.importorskip("numpy")
+
+    count = 500
+    node = LoopFor(None)
+    xs, ys, zs = node.transform_coords(init_value, [MATRIX] * count)
+
+    matrix = np.array(MATRIX.rows)
+    if isinstance(init_value, Geometry.Vector3D):
+        matrix[:3, 3] = 0.0
+    start = np.array([init_value.X, init_value.Y, init_value.Z, 1.0])
+    reference = [np.linalg.matrix_power(matrix, power) @ start for power in range(1, count + 1)]
+
+    assert count >= NodeLoopFor.MATRIX_POWER_THRESHOLD
+    assert np.allclose(np.array([xs, ys, zs]).T, np.array(reference)[:, :3], rtol= 1e-9, atol= 1e-9)
@@ -0,0 +1,29 @@
+""" Element by element operations of the OperatorModulo node
+"""
+
+import pytest
+
+from NodeOperatorModulo import NodeOperatorModulo
+
+
+@pytest.mark.parametrize("x, y, operation, lacing, result", [
+    ([[1, 5], [2, 2]], [[3, 3], [1, 1]], "max", "Longest", [[3, 5], [2, 2]]),
+    ([[1, 5], [2, 2]], [[3, 3], [1, 1]], "min", "Longest", [[1, 3], [1, 1]]),
+    ([[1, 5], 4], [3, [9, 0]], "max", "Longest", [[3, 5], [9, 4]]),
+    ([[1, 5], [2, 2]], 2, "min", "Longest", [[1, 2], [2, 2]]),
+    ([5, 7, 9], [2, 4], "%", "Longest", [1, 3, 1]),
+    ([5, 7, 9], [2, 4], "%", "Shortest", [1, 3]),
+    ([5, 7], [2, 4], "%", "Cross", [[1, 1], [1, 3]]),
+    ])
+def test_operations(run_node, x, y, operation, lacing, result):
+    node = run_node(NodeOperatorModulo, X= x, Y= y, Operation= operation, Lacing= lacing)
+
+    assert node.build_ele.Result.value == result
+    assert node.error == node.warning == ""
+
+
+def test_element_errors(run_node):
+    node = run_node(NodeOperatorModulo, X= [5, [6, 7]], Y= [2, [0, 3]])
+
+    assert node.build_ele.Result.value == [1, [None, 1]]
+    assert node.warning == "ZeroDivisionError: 1 value(s) set to None"